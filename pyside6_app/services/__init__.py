@@ -1,5 +1,6 @@
 """Service modules."""
 
 from .generator import GeneratorService
+from .verifier import VerifierService
 
-__all__ = ["GeneratorService"]
+__all__ = ["GeneratorService", "VerifierService"]
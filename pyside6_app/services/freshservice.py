@@ -8,7 +8,9 @@ import sys
 from pathlib import Path
 
 # Add parent directory to path to import freshservice_client.py
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_ROOT = Path(__file__).parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
 
 from freshservice_client import FreshserviceClient
 
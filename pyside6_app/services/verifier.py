@@ -0,0 +1,204 @@
+"""
+Async wrapper for Freshservice ticket verification.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool, Slot
+
+# Add parent directory to path for imports
+_ROOT = Path(__file__).parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from freshservice_client import FreshserviceClient
+from ticket_verifier import TicketVerifier
+
+
+class VerifierWorker(QRunnable):
+    """
+    Worker for async ticket verification.
+
+    Signals are emitted via a Signals object since QRunnable doesn't inherit QObject.
+    """
+
+    class Signals(QObject):
+        """Signals for verifier worker."""
+        result_ready = Signal(dict)  # Per-ticket result
+        progress_updated = Signal(int, int)  # current, total
+        verification_complete = Signal(dict)
+        error_occurred = Signal(str)
+
+    def __init__(
+        self,
+        domain: str,
+        api_key: str,
+        sent_emails: List[Dict],
+        recipient_email: str,
+        batch_start_time: datetime,
+        sender_email: Optional[str] = None
+    ):
+        """
+        Initialize verifier worker.
+
+        Args:
+            domain: Freshservice domain
+            api_key: Freshservice API key
+            sent_emails: Sent email dictionaries with expected values
+            recipient_email: Email address that received the tickets
+            batch_start_time: When the batch started
+            sender_email: Email address that sent the emails
+        """
+        super().__init__()
+        self.signals = self.Signals()
+        self.domain = domain
+        self.api_key = api_key
+        self.sent_emails = sent_emails
+        self.recipient_email = recipient_email
+        self.batch_start_time = batch_start_time
+        self.sender_email = sender_email
+        self._is_cancelled = False
+
+    def cancel(self):
+        """Request cancellation (results are discarded)."""
+        self._is_cancelled = True
+
+    @Slot()
+    def run(self):
+        """Run verification in background thread."""
+        try:
+            verifier = TicketVerifier(FreshserviceClient(self.domain, self.api_key))
+            total = len(self.sent_emails)
+            results = []
+
+            for current, result in enumerate(verifier.verify_batch_iter(
+                sent_emails=self.sent_emails,
+                recipient_email=self.recipient_email,
+                batch_start_time=self.batch_start_time,
+                sender_email=self.sender_email
+            ), 1):
+                if self._is_cancelled:
+                    return
+                results.append(result)
+                self.signals.result_ready.emit(result)
+                self.signals.progress_updated.emit(current, total)
+
+            if not self._is_cancelled:
+                report = verifier.build_batch_report(results, self.sent_emails, self.batch_start_time)
+                self.signals.verification_complete.emit(report)
+
+        except Exception as e:
+            if not self._is_cancelled:
+                self.signals.error_occurred.emit(str(e))
+
+
+class VerifierService(QObject):
+    """
+    Service for async ticket verification.
+
+    Signals:
+        result_ready: Emitted with each per-ticket result as it is verified
+        progress_updated: Emitted with (current, total) after each result
+        verification_complete: Emitted with the verification results dict
+        error_occurred: Emitted when verification fails
+    """
+
+    result_ready = Signal(dict)
+    progress_updated = Signal(int, int)
+    verification_complete = Signal(dict)
+    error_occurred = Signal(str)
+
+    def __init__(self, parent: QObject = None):
+        """Initialize verifier service."""
+        super().__init__(parent)
+        self.thread_pool = QThreadPool.globalInstance()
+        self.current_worker = None
+
+    def is_running(self) -> bool:
+        """Check whether a verification is in progress."""
+        return self.current_worker is not None
+
+    def verify_tickets(
+        self,
+        domain: str,
+        api_key: str,
+        sent_emails: List[Dict],
+        recipient_email: str,
+        batch_start_time: datetime,
+        sender_email: Optional[str] = None
+    ) -> bool:
+        """
+        Start async verification.
+
+        Args:
+            domain: Freshservice domain
+            api_key: Freshservice API key
+            sent_emails: Sent email dictionaries with expected values
+            recipient_email: Email address that received the tickets
+            batch_start_time: When the batch started
+            sender_email: Email address that sent the emails
+
+        Returns:
+            True if verification started successfully
+        """
+        try:
+            self.current_worker = VerifierWorker(
+                domain=domain,
+                api_key=api_key,
+                sent_emails=sent_emails,
+                recipient_email=recipient_email,
+                batch_start_time=batch_start_time,
+                sender_email=sender_email
+            )
+
+            # Connect signals
+            self.current_worker.signals.result_ready.connect(self._on_result)
+            self.current_worker.signals.progress_updated.connect(self._on_progress)
+            self.current_worker.signals.verification_complete.connect(self._on_complete)
+            self.current_worker.signals.error_occurred.connect(self._on_error)
+
+            # Start in thread pool
+            self.thread_pool.start(self.current_worker)
+
+            return True
+
+        except Exception as e:
+            self.current_worker = None
+            self.error_occurred.emit(f"Failed to start verification: {str(e)}")
+            return False
+
+    def cancel_verification(self):
+        """Cancel current verification."""
+        if self.current_worker:
+            self.current_worker.cancel()
+            self.current_worker = None
+
+    def _is_current(self, signals: QObject) -> bool:
+        """Check that a signal came from the active (not a cancelled) worker."""
+        return self.current_worker is not None and signals is self.current_worker.signals
+
+    def _on_result(self, result: dict):
+        """Forward a per-ticket result from the active worker."""
+        if self._is_current(self.sender()):
+            self.result_ready.emit(result)
+
+    def _on_progress(self, current: int, total: int):
+        """Forward progress from the active worker."""
+        if self._is_current(self.sender()):
+            self.progress_updated.emit(current, total)
+
+    def _on_complete(self, results: dict):
+        """Forward results from the active worker."""
+        if not self._is_current(self.sender()):
+            return
+        self.current_worker = None
+        self.verification_complete.emit(results)
+
+    def _on_error(self, message: str):
+        """Forward errors from the active worker."""
+        if not self._is_current(self.sender()):
+            return
+        self.current_worker = None
+        self.error_occurred.emit(message)
@@ -212,6 +212,11 @@ class AppState(BaseModel):
         self.drafts.append(draft)
         self.update_last_modified()
 
+    def add_drafts(self, drafts: List[DraftEmail]) -> None:
+        """Add several draft emails."""
+        self.drafts.extend(drafts)
+        self.update_last_modified()
+
     def clear_drafts(self) -> None:
         """Clear all drafts."""
         self.drafts.clear()
@@ -226,14 +231,20 @@ class AppState(BaseModel):
                 return draft
         return None
 
-    def update_draft_status(self, draft_id: int, status: EmailStatus, error_message: Optional[str] = None) -> None:
-        """Update draft status."""
+    def update_draft_status(
+        self,
+        draft_id: int,
+        status: EmailStatus,
+        error_message: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Update draft status (timestamp defaults to now for SENT)."""
         draft = self.get_draft_by_id(draft_id)
         if draft:
             draft.status = status
             draft.error_message = error_message
             if status == EmailStatus.SENT:
-                draft.sent_timestamp = datetime.now()
+                draft.sent_timestamp = timestamp or datetime.now()
             self.update_last_modified()
 
     def add_history(self, batch: SendBatchHistory) -> None:
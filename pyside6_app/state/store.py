@@ -4,12 +4,20 @@ State store with persistence to JSON and signal emission.
 
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Any, List
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal
 
-from .models import AppState
+# Add parent directory to path for imports
+_ROOT = Path(__file__).parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from ticket_counter import TicketCounter
+
+from .models import AppState, DraftEmail, EmailStatus
 
 
 class StateStore(QObject):
@@ -21,6 +29,8 @@ class StateStore(QObject):
         drafts_changed: Emitted when drafts list changes
         connections_changed: Emitted when connection state changes
         preflight_changed: Emitted when preflight state changes
+        draft_added: Emitted when a single draft is appended
+        draft_status_changed: Emitted with (draft, old_status, new_status)
     """
 
     # Signals
@@ -28,6 +38,8 @@ class StateStore(QObject):
     drafts_changed = Signal(list)  # List[DraftEmail]
     connections_changed = Signal(object)  # ConnectionsState
     preflight_changed = Signal(object)  # PreflightState
+    draft_added = Signal(object)  # DraftEmail
+    draft_status_changed = Signal(object, object, object)  # DraftEmail, EmailStatus, EmailStatus
 
     def __init__(self, config_dir: Optional[Path] = None):
         """
@@ -97,6 +109,88 @@ class StateStore(QObject):
         self.state_changed.emit(self._state)
         self._schedule_save()
 
+    def add_draft(self, draft: DraftEmail) -> None:
+        """
+        Append a single draft and emit draft_added.
+
+        drafts_changed is reserved for bulk changes (load/clear), so
+        listeners can update incrementally while drafts stream in.
+
+        Args:
+            draft: Draft to append
+        """
+        self._state.add_draft(draft)
+        self.draft_added.emit(draft)
+        self.state_changed.emit(self._state)
+        self._schedule_save()
+
+    def add_drafts(self, drafts: List[DraftEmail]) -> None:
+        """
+        Append several drafts with a single save.
+
+        Args:
+            drafts: Drafts to append
+        """
+        self._state.add_drafts(drafts)
+        for draft in drafts:
+            self.draft_added.emit(draft)
+        self.state_changed.emit(self._state)
+        self._schedule_save()
+
+    def set_draft_status(
+        self,
+        draft_id: int,
+        status: EmailStatus,
+        error_message: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Update a single draft's status and emit draft_status_changed.
+
+        Args:
+            draft_id: Draft ID
+            status: New status
+            error_message: Optional error message (for ERROR status)
+            timestamp: Optional sent time (for SENT status, default: now)
+        """
+        draft = self._state.get_draft_by_id(draft_id)
+        if draft is None:
+            return
+
+        old_status = draft.status
+        self._state.update_draft_status(draft_id, status, error_message, timestamp)
+        self.draft_status_changed.emit(draft, old_status, status)
+        self.state_changed.emit(self._state)
+        self._schedule_save()
+
+    def set_microsoft_field(self, name: str, value: Any) -> None:
+        """
+        Set a Microsoft connection field and emit connections signal.
+
+        Args:
+            name: Field name on MicrosoftConnection
+            value: New value
+        """
+        setattr(self._state.connections.microsoft, name, value)
+        self._state.update_last_modified()
+        self.connections_changed.emit(self._state.connections)
+        self.state_changed.emit(self._state)
+        self._schedule_save()
+
+    def set_freshservice_field(self, name: str, value: Any) -> None:
+        """
+        Set a Freshservice connection field and emit connections signal.
+
+        Args:
+            name: Field name on FreshserviceConnection
+            value: New value
+        """
+        setattr(self._state.connections.freshservice, name, value)
+        self._state.update_last_modified()
+        self.connections_changed.emit(self._state.connections)
+        self.state_changed.emit(self._state)
+        self._schedule_save()
+
     def update_preflight(self, updater: Callable[[AppState], None]) -> None:
         """Update preflight and emit specific signal."""
         updater(self._state)
@@ -208,20 +302,28 @@ class StateStore(QObject):
         """
         self._secrets[key] = value
 
-    def migrate_from_env(self, env_file: Path) -> bool:
+    def migrate_from_env(self, env_file: Path, force: bool = False) -> bool:
         """
         Migrate configuration from .env file (one-time migration from tkinter app).
 
+        Skipped when appstate.json is newer than the .env file, since it
+        already reflects it.
+
         Args:
             env_file: Path to .env file
+            force: Migrate even if appstate.json is up to date
 
         Returns:
-            True if migration successful
+            True if migration successful (or not needed)
         """
         try:
             if not env_file.exists():
                 return False
 
+            if (not force and self.state_file.exists()
+                    and self.state_file.stat().st_mtime >= env_file.stat().st_mtime):
+                return True
+
             env_vars = {}
             with open(env_file, 'r', encoding='utf-8') as f:
                 for line in f:
@@ -270,17 +372,10 @@ class StateStore(QObject):
                 except ValueError:
                     pass
 
-            # Try to migrate ticket counter
-            counter_file = env_file.parent / "ticket_counter.json"
-            if counter_file.exists():
-                try:
-                    with open(counter_file, 'r', encoding='utf-8') as f:
-                        counter_data = json.load(f)
-                        # Old format uses 'last_ticket_number', next is +1
-                        last_num = counter_data.get('last_ticket_number', 0)
-                        self._state.generation.next_ticket_number = last_num + 1
-                except Exception:
-                    pass
+            # Try to migrate ticket counter (same files the CLI/tkinter TicketCounter uses)
+            last_num = TicketCounter.read_last_number()
+            if last_num is not None:
+                self._state.generation.next_ticket_number = last_num + 1
 
             self._state.update_last_modified()
             self.save()
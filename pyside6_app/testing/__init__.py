@@ -0,0 +1,7 @@
+"""Helpers shared by the manual test scripts."""
+
+from .qapp import get_qapp
+from .runner import run_test
+from .store import get_state_store
+
+__all__ = ["get_qapp", "run_test", "get_state_store"]
@@ -0,0 +1,20 @@
+"""
+Shared QApplication for the manual test scripts.
+"""
+
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+
+def get_qapp() -> QApplication:
+    """
+    Get the running QApplication, creating it on first use.
+
+    PySide6 allows only one QApplication per process, so scripts run
+    together (e.g. under pytest) have to share it.
+
+    Returns:
+        The QApplication instance
+    """
+    return QApplication.instance() or QApplication(sys.argv)
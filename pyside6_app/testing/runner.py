@@ -0,0 +1,29 @@
+"""
+Shared harness for the manual test scripts.
+"""
+
+from typing import Callable
+
+from .qapp import get_qapp
+
+
+def run_test(test: Callable[[], int]) -> int:
+    """
+    Run a test script function with the shared QApplication.
+
+    Args:
+        test: Function returning 0 on success, non-zero on failure
+
+    Returns:
+        The test's return code, or 1 if it raised
+    """
+    app = get_qapp()
+    try:
+        return test()
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    finally:
+        app.processEvents()  # Leave the app running for other scripts
@@ -0,0 +1,25 @@
+"""
+Shared StateStore for the manual test scripts.
+"""
+
+from typing import Optional
+
+from ..state.store import StateStore
+
+_store: Optional[StateStore] = None
+
+
+def get_state_store() -> StateStore:
+    """
+    Get the StateStore shared by test scripts in this process.
+
+    Built on first use, so scripts run together (e.g. under pytest) don't
+    each re-read the state file and secrets.
+
+    Returns:
+        The shared StateStore
+    """
+    global _store
+    if _store is None:
+        _store = StateStore()
+    return _store
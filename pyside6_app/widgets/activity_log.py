@@ -22,6 +22,9 @@ class ActivityLogWidget(ElevatedCardWidget):
 
     clear_log_clicked = Signal()
 
+    # Oldest entries are dropped once the log holds this many
+    DEFAULT_MAX_ENTRIES = 500
+
     def __init__(self, parent: QWidget = None):
         """
         Initialize activity log widget.
@@ -63,6 +66,11 @@ class ActivityLogWidget(ElevatedCardWidget):
         """)
         layout.addWidget(self.log_text, 1)
 
+        # Consecutive identical entries are collapsed into one line
+        self._last_entry = None
+        self._repeat_count = 0
+        self.set_max_entries(self.DEFAULT_MAX_ENTRIES)
+
         # Clear button
         self.clear_button = PushButton("Clear Log")
         self.clear_button.setIcon(FluentIcon.DELETE)
@@ -70,15 +78,41 @@ class ActivityLogWidget(ElevatedCardWidget):
         self.clear_button.clicked.connect(self.clear_log)
         layout.addWidget(self.clear_button)
 
-    def add_log(self, message: str, level: str = "info"):
+    def add_log(self, message: str, level: str = "info", timestamp: datetime = None):
         """
         Add a log entry.
 
         Args:
             message: Log message
             level: Log level (info, success, warning, error)
+            timestamp: Time the event happened (default: now)
+        """
+        self._append_entry(level, message, timestamp)
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+
+    def add_batch(self, entries: list):
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        Add several log entries with a single repaint.
+
+        Args:
+            entries: (level, message) or (level, message, timestamp) tuples
+        """
+        if not entries:
+            return
+
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            for entry in entries:
+                self._append_entry(*entry)
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_text.ensureCursorVisible()
+
+    def _append_entry(self, level: str, message: str, timestamp: datetime = None):
+        """Append one formatted entry without moving the view."""
+        timestamp = (timestamp or datetime.now()).strftime("%H:%M:%S")
 
         # Color code by level - use brighter colors for dark mode
         if isDarkTheme():
@@ -98,12 +132,28 @@ class ActivityLogWidget(ElevatedCardWidget):
         color = colors.get(level, colors["info"])
 
         # Format entry
-        entry = f'<span style="color: {color};">[{timestamp}]</span> {message}<br>'
+        entry = f'<span style="color: {color};">[{timestamp}]</span> {message}'
+
+        if (level, message) == self._last_entry:
+            # Rewrite the last line with a repeat count instead of appending
+            self._repeat_count += 1
+            cursor = QTextCursor(self.log_text.document().lastBlock())
+            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertHtml(f'{entry} <i>({self._repeat_count - 1} similar suppressed)</i>')
+        else:
+            # Each entry is its own block so the document's block cap acts as a ring buffer
+            self._last_entry = (level, message)
+            self._repeat_count = 1
+            self.log_text.append(entry)
 
-        # Append to log
-        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
-        self.log_text.insertHtml(entry)
-        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+    def set_max_entries(self, count: int):
+        """
+        Limit the number of retained log entries.
+
+        Args:
+            count: Maximum entries to keep (0 for unlimited)
+        """
+        self.log_text.document().setMaximumBlockCount(count)
 
     def add_info(self, message: str):
         """Add info log entry."""
@@ -157,6 +207,8 @@ class ActivityLogWidget(ElevatedCardWidget):
     def clear_log(self):
         """Clear all log entries."""
         self.log_text.clear()
+        self._last_entry = None
+        self._repeat_count = 0
         self.add_info("Log cleared")
         self.set_status("Ready", "info")
 
@@ -25,11 +25,13 @@ class GenerationCard(ElevatedCardWidget):
         preview_clicked: Emitted when preview button clicked
         generate_clicked: Emitted when generate button clicked
         clear_clicked: Emitted when clear button clicked
+        settings_changed: Emitted when any generation setting changes
     """
 
     preview_clicked = Signal()
     generate_clicked = Signal()
     clear_clicked = Signal()
+    settings_changed = Signal()
 
     def __init__(self, state_store: StateStore, parent: QWidget = None):
         """
@@ -41,8 +43,25 @@ class GenerationCard(ElevatedCardWidget):
         """
         super().__init__(parent)
         self.state_store = state_store
+        self._next_ticket_number = None
+        self._built = False  # Child widgets are created on first show
+
+    def showEvent(self, event):
+        """Build the UI before the card is first shown."""
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self):
+        """Create, load and connect the child widgets once."""
+        if self._built:
+            return
+        self._built = True
+        self._build_ui()
+        self._load_from_state()
+        self._init_connections()
 
-        # Create UI
+    def _build_ui(self):
+        """Create the child widgets."""
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -187,12 +206,6 @@ class GenerationCard(ElevatedCardWidget):
 
         layout.addLayout(button_row)
 
-        # Load initial state
-        self._load_from_state()
-
-        # Connect signals
-        self._init_connections()
-
     def _init_connections(self):
         """Initialize signal connections."""
         # Input changes -> update state
@@ -244,7 +257,12 @@ class GenerationCard(ElevatedCardWidget):
     def _update_next_ticket_label(self):
         """Update next ticket number label."""
         next_num = self.state_store.state.generation.next_ticket_number
+        if next_num == self._next_ticket_number:
+            return
+
+        self._next_ticket_number = next_num
         self.next_ticket_label.setText(f"Next: #{next_num}")
+        self.settings_changed.emit()
 
     def _update_char_count(self):
         """Update character count label."""
@@ -265,18 +283,21 @@ class GenerationCard(ElevatedCardWidget):
         self.state_store.update_state(
             lambda s: setattr(s.generation, 'email_count', value)
         )
+        self.settings_changed.emit()
 
     def _on_quality_changed(self, quality: QualityLevel):
         """Handle quality change."""
         self.state_store.update_state(
             lambda s: setattr(s.generation, 'quality', quality)
         )
+        self.settings_changed.emit()
 
     def _on_wait_time_changed(self, value: int):
         """Handle wait time change."""
         self.state_store.update_state(
             lambda s: setattr(s.generation, 'wait_time_ms', value)
         )
+        self.settings_changed.emit()
 
     def _on_mode_changed(self, key: str):
         """Handle mode change."""
@@ -285,6 +306,7 @@ class GenerationCard(ElevatedCardWidget):
         self.state_store.update_state(
             lambda s: setattr(s.generation, 'mode', mode)
         )
+        self.settings_changed.emit()
 
         # Update description
         if mode == GenerationMode.GUIDED:
@@ -310,6 +332,7 @@ class GenerationCard(ElevatedCardWidget):
         self.state_store.update_state(
             lambda s: setattr(s.generation, 'custom_prompt', text)
         )
+        self.settings_changed.emit()
 
         self._update_char_count()
 
@@ -357,5 +380,6 @@ class GenerationCard(ElevatedCardWidget):
 
     def set_generation_enabled(self, enabled: bool):
         """Enable/disable generation controls."""
+        self._ensure_built()
         self.preview_button.setEnabled(enabled)
         self.generate_button.setEnabled(enabled)
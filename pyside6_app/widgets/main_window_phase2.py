@@ -3,7 +3,14 @@ Main application window with frameless design and 12-column grid layout - Phase
 Complete with generation and review cards integrated.
 """
 
-from PySide6.QtCore import Qt, QTimer
+import sys
+import time
+from collections import Counter, deque
+from datetime import datetime
+from html import escape
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QTimer, QEvent
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QGridLayout, QVBoxLayout, QHBoxLayout,
     QScrollArea, QSpacerItem, QSizePolicy, QFileDialog, QMenuBar, QMenu, QApplication
@@ -17,6 +24,7 @@ from ..state.store import StateStore
 from ..utils.theme import ThemeManager
 from ..state.models import EmailStatus, ThemeMode
 from ..services.generator import GeneratorService
+from ..services.verifier import VerifierService
 from ..utils.export import CSVExporter
 from .connection_cards import MicrosoftCard, FreshserviceCard
 from .generation_card import GenerationCard
@@ -27,6 +35,35 @@ from .error_banner import ErrorBanner
 from .onboarding_dialog import OnboardingDialog
 from ..utils.shortcuts import setup_shortcuts
 
+# Repository root holds the shared CLI modules (email_sender, etc.)
+_ROOT = Path(__file__).parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from email_sender import EmailSender
+
+
+# Per-draft HTML report templates (bound str.format, parsed once at import)
+_FIELD_TMPL = (
+    """        <div class="field"><span class="field-label">{label}:</span>"""
+    """<span class="field-value">{value}</span></div>\n"""
+).format
+
+_TICKET_TMPL = """
+    <div class="ticket">
+        <div class="ticket-header">
+            <span class="ticket-id">Ticket #{id}</span>
+            <span class="status {status_class}">{status}</span>
+        </div>
+        <div class="field"><span class="field-label">Type:</span><span class="field-value">{type}</span></div>
+        <div class="field"><span class="field-label">Priority:</span><span class="field-value">{priority}</span></div>
+        <div class="field"><span class="field-label">Category:</span><span class="field-value">{category}</span></div>
+{optional_fields}        <div class="field"><span class="field-label">Recipient:</span><span class="field-value">{recipient}</span></div>
+        <div class="subject">{subject}</div>
+        <div class="body">{body}</div>
+    </div>
+""".format
+
 
 class MainWindow(QMainWindow):
     """
@@ -40,6 +77,21 @@ class MainWindow(QMainWindow):
     - Settings and help access
     """
 
+    # Most log entries buffered while the activity log is not visible
+    PENDING_LOG_LIMIT = 500
+
+    # Streamed drafts are coalesced over this window
+    DRAFT_FLUSH_MS = 100
+
+    # Generation progress labels refresh at most this often
+    PROGRESS_FLUSH_MS = 100
+
+    # Send loop writes one activity log progress line per this many drafts
+    SEND_LOG_INTERVAL = 10
+
+    # Fixed height of the sticky footer row
+    FOOTER_HEIGHT = 56
+
     def __init__(self, state_store: StateStore, theme_manager: ThemeManager):
         """
         Initialize main window.
@@ -56,6 +108,50 @@ class MainWindow(QMainWindow):
         # Initialize generator service
         self.generator_service = GeneratorService(self)
 
+        # Initialize verifier service
+        self.verifier_service = VerifierService(self)
+        self._verify_sent_count = 0
+
+        # Visible InfoBars keyed by (level, position), replaced by _notify
+        self._infobar_pool = {}
+
+        # Log entries held back while the activity log is hidden or minimized
+        self._pending_log = deque(maxlen=self.PENDING_LOG_LIMIT)
+
+        # Streamed drafts, flushed every DRAFT_FLUSH_MS
+        self._pending_drafts = []
+        self._draft_timer = QTimer(self)
+        self._draft_timer.setSingleShot(True)
+        self._draft_timer.setInterval(self.DRAFT_FLUSH_MS)
+        self._draft_timer.timeout.connect(self._flush_drafts)
+
+        # Streamed verification log lines and progress, flushed every DRAFT_FLUSH_MS
+        self._pending_verify_log = []
+        self._verify_progress = None
+        self._verify_timer = QTimer(self)
+        self._verify_timer.setSingleShot(True)
+        self._verify_timer.setInterval(self.DRAFT_FLUSH_MS)
+        self._verify_timer.timeout.connect(self._flush_verification)
+
+        # Latest (current, total) generation progress, flushed every PROGRESS_FLUSH_MS
+        self._progress_pending = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Draft counters (kept in sync incrementally from store signals)
+        self._drafts_count = 0
+        self._ready_count = 0
+        self._sent_count = 0
+        self._shown_drafts_count = None
+
+        # Report output directory (resolved once)
+        self._desktop_dir = Path.home() / "Desktop"
+
+        # Generation settings snapshot (rebuilt after settings change)
+        self._cached_settings = None
+
         # Set window properties
         self.setWindowTitle("IT Ticket Email Generator")
         self.setMinimumSize(960, 600)  # Reduced for smaller screens
@@ -87,13 +183,10 @@ class MainWindow(QMainWindow):
         main_layout.setSpacing(16)
 
         # Configure column stretches for 3-6-3 layout
-        for i in range(12):
-            if 0 <= i <= 2:
-                main_layout.setColumnStretch(i, 1)
-            elif 3 <= i <= 8:
-                main_layout.setColumnStretch(i, 2)
-            elif 9 <= i <= 11:
-                main_layout.setColumnStretch(i, 1)
+        for i in (0, 1, 2, 9, 10, 11):
+            main_layout.setColumnStretch(i, 1)
+        for i in (3, 4, 5, 6, 7, 8):
+            main_layout.setColumnStretch(i, 2)
 
         # Row stretches
         main_layout.setRowStretch(0, 0)  # Header
@@ -107,10 +200,8 @@ class MainWindow(QMainWindow):
         self._create_right_rail(main_layout)
         self._create_sticky_footer(main_layout)
 
-        # Create review detail sheet (overlay)
-        self.review_sheet = ReviewDetailSheet(self.state_store, self)
-        self.review_sheet.setParent(central_widget)
-        self.review_sheet.raise_()
+        # Review detail sheet (overlay) is created on first row click
+        self.review_sheet = None
 
         # Setup keyboard shortcuts
         self._setup_shortcuts()
@@ -130,7 +221,7 @@ class MainWindow(QMainWindow):
 
         # Only check if state says we're authenticated
         if ms.is_authenticated and ms.client_id and ms.tenant_id:
-            self.activity_log.add_info("Verifying Microsoft authentication...")
+            self._log("info", "Verifying Microsoft authentication...")
 
             try:
                 auth_service = MicrosoftAuthService(ms.client_id, ms.tenant_id)
@@ -141,28 +232,23 @@ class MainWindow(QMainWindow):
                 if token:
                     # Token is valid, update the stored token
                     self.state_store.set_secret('microsoft_access_token', token['access_token'])
-                    self.activity_log.add_success("Microsoft authentication verified (using cached token)")
+                    self._log("success", "Microsoft authentication verified (using cached token)")
                 else:
                     # Token is invalid/expired and can't be refreshed
-                    self.state_store.update_connections(
-                        lambda s: setattr(s.connections.microsoft, 'is_authenticated', False)
-                    )
-                    self.activity_log.add_warning("Microsoft authentication expired - please re-authenticate")
-
-                    InfoBar.warning(
-                        title="Authentication Expired",
-                        content="Your Microsoft session has expired. Please authenticate again.",
-                        parent=self,
-                        duration=5000,
-                        position=InfoBarPosition.TOP_RIGHT
+                    self.state_store.set_microsoft_field('is_authenticated', False)
+                    self._log("warning", "Microsoft authentication expired - please re-authenticate")
+
+                    self._notify(
+                        "warning",
+                        "Authentication Expired",
+                        "Your Microsoft session has expired. Please authenticate again.",
+                        duration=5000
                     )
 
             except Exception as e:
                 # On error, mark as not authenticated
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.microsoft, 'is_authenticated', False)
-                )
-                self.activity_log.add_error(f"Authentication check failed: {str(e)}")
+                self.state_store.set_microsoft_field('is_authenticated', False)
+                self._log("error", f"Authentication check failed: {str(e)}")
 
     def _create_title_bar(self):
         """Create menu bar with theme toggle and settings."""
@@ -253,7 +339,7 @@ class MainWindow(QMainWindow):
 
         # Activity log widget
         self.activity_log = ActivityLogWidget(self)
-        self.activity_log.add_info("Application started")
+        self._log("info", "Application started")
         self.activity_log.set_status("Ready", "success")
 
         scroll_area.setWidget(self.activity_log)
@@ -262,7 +348,7 @@ class MainWindow(QMainWindow):
     def _create_sticky_footer(self, layout: QGridLayout):
         """Create sticky footer with status and primary CTA."""
         footer = QWidget()
-        footer.setFixedHeight(56)
+        footer.setFixedHeight(self.FOOTER_HEIGHT)
         footer.setStyleSheet("""
             QWidget {
                 background-color: palette(base);
@@ -309,9 +395,14 @@ class MainWindow(QMainWindow):
         """Initialize signal connections."""
         # State changes
         self.state_store.drafts_changed.connect(self._on_drafts_changed)
+        self.state_store.draft_added.connect(self._on_draft_added)
+        self.state_store.draft_status_changed.connect(self._on_draft_status_changed)
         self.state_store.connections_changed.connect(self._on_connections_changed)
         self.state_store.preflight_changed.connect(self._on_preflight_changed)
 
+        # Seed draft counters from loaded state
+        self._on_drafts_changed(self.state_store.state.drafts)
+
         # Theme changes
         self.theme_manager.theme_changed.connect(self._on_theme_changed)
 
@@ -323,6 +414,8 @@ class MainWindow(QMainWindow):
         self.generation_card.preview_clicked.connect(self._on_preview_clicked)
         self.generation_card.generate_clicked.connect(self._on_generate_clicked)
         self.generation_card.clear_clicked.connect(self._on_clear_clicked)
+        self.generation_card.settings_changed.connect(self._invalidate_generation_settings)
+        self.state_store.connections_changed.connect(self._invalidate_generation_settings)
 
         # Review card signals
         self.review_card.row_clicked.connect(self._on_review_row_clicked)
@@ -340,8 +433,11 @@ class MainWindow(QMainWindow):
         self.generator_service.generation_complete.connect(self._on_generation_complete)
         self.generator_service.error_occurred.connect(self._on_generation_error)
 
-        # Review sheet signals
-        self.review_sheet.mark_ready_clicked.connect(self._on_mark_draft_ready)
+        # Verifier service signals
+        self.verifier_service.result_ready.connect(self._on_verification_result)
+        self.verifier_service.progress_updated.connect(self._on_verification_progress)
+        self.verifier_service.verification_complete.connect(self._on_verification_done)
+        self.verifier_service.error_occurred.connect(self._on_verification_error)
 
         # Confirm send button
         self.confirm_send_button.clicked.connect(self._on_confirm_send)
@@ -363,7 +459,7 @@ class MainWindow(QMainWindow):
 
     def _clear_selection_or_close_sheet(self):
         """Handle Escape - close sheet if open, otherwise clear selection."""
-        if self.review_sheet.isVisible():
+        if self.review_sheet is not None and self.review_sheet.isVisible():
             self.review_sheet.hide()
         else:
             self.review_card.clear_selection()
@@ -389,6 +485,16 @@ class MainWindow(QMainWindow):
 
     def _on_cancel_generation(self):
         """Handle cancel generation request from review card."""
+        if self.verifier_service.is_running():
+            # Verification only reads from Freshservice, so stop without confirming
+            self.verifier_service.cancel_verification()
+            self._flush_verification()
+            self._log("warning", "Verification cancelled by user")
+            self.activity_log.set_status("Ready", "success")
+            self.review_card.hide_progress()
+            self.verify_button.setEnabled(True)
+            return
+
         result = MessageBox(
             "Cancel Generation",
             "Stop generating? Emails already generated will be kept.",
@@ -397,7 +503,10 @@ class MainWindow(QMainWindow):
 
         if result:
             self.generator_service.cancel_generation()
-            self.activity_log.add_warning("Generation cancelled by user")
+            self._discard_pending_progress()
+            self._flush_drafts()
+            self.review_card.end_streaming()
+            self._log("warning", "Generation cancelled by user")
             self.review_card.hide_progress()
             self.generation_card.set_generation_enabled(True)
 
@@ -423,7 +532,7 @@ class MainWindow(QMainWindow):
 
         if not ms.client_id or not ms.tenant_id:
             self._show_error("Please enter Client ID and Tenant ID first.")
-            self.activity_log.add_error("Authentication failed: Missing credentials")
+            self._log("error", "Authentication failed: Missing credentials")
             return
 
         # Check if already authenticated
@@ -443,24 +552,19 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     print(f"[WARNING] Error clearing token cache: {e}")
 
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.microsoft, 'is_authenticated', False)
-                )
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.microsoft, 'token_expiry', None)
-                )
+                self.state_store.set_microsoft_field('is_authenticated', False)
+                self.state_store.set_microsoft_field('token_expiry', None)
 
                 # Clear the stored access token
                 self.state_store.set_secret('microsoft_access_token', '')
 
-                self.activity_log.add_success("Signed out from Microsoft 365")
+                self._log("success", "Signed out from Microsoft 365")
 
-                InfoBar.success(
-                    title="Signed Out",
-                    content="Successfully signed out of Microsoft 365.",
-                    parent=self,
-                    duration=2000,
-                    position=InfoBarPosition.TOP_RIGHT
+                self._notify(
+                    "success",
+                    "Signed Out",
+                    "Successfully signed out of Microsoft 365.",
+                    duration=2000
                 )
             return
 
@@ -468,17 +572,11 @@ class MainWindow(QMainWindow):
         try:
             auth_service = MicrosoftAuthService(ms.client_id, ms.tenant_id)
 
-            self.activity_log.add_info("Starting Microsoft authentication...")
+            self._log("info", "Starting Microsoft authentication...")
             self.activity_log.set_status("Authenticating...", "busy")
 
             # Open browser for authentication
-            InfoBar.info(
-                title="Authenticating",
-                content="Opening browser for Microsoft authentication...",
-                parent=self,
-                duration=3000,
-                position=InfoBarPosition.TOP_RIGHT
-            )
+            self._notify("info", "Authenticating", "Opening browser for Microsoft authentication...")
 
             # Perform authentication (this will open browser)
             token = auth_service.authenticate()
@@ -488,30 +586,24 @@ class MainWindow(QMainWindow):
                 self.state_store.set_secret('microsoft_access_token', token['access_token'])
 
                 # Update state
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.microsoft, 'is_authenticated', True)
-                )
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.microsoft, 'token_expiry', token.get('expires_at'))
-                )
+                self.state_store.set_microsoft_field('is_authenticated', True)
+                self.state_store.set_microsoft_field('token_expiry', token.get('expires_at'))
 
-                self.activity_log.add_success("Microsoft 365 authentication successful")
+                self._log("success", "Microsoft 365 authentication successful")
                 self.activity_log.set_status("Ready", "success")
 
-                InfoBar.success(
-                    title="Authentication Successful",
-                    content="Successfully authenticated with Microsoft 365.",
-                    parent=self,
-                    duration=3000,
-                    position=InfoBarPosition.TOP_RIGHT
+                self._notify(
+                    "success",
+                    "Authentication Successful",
+                    "Successfully authenticated with Microsoft 365."
                 )
             else:
-                self.activity_log.add_error("Authentication failed or cancelled")
+                self._log("error", "Authentication failed or cancelled")
                 self.activity_log.set_status("Ready", "success")
                 self._show_error("Authentication failed or was cancelled.")
 
         except Exception as e:
-            self.activity_log.add_error(f"Authentication error: {str(e)}")
+            self._log("error", f"Authentication error: {str(e)}")
             self.activity_log.set_status("Ready", "success")
             self._show_error(f"Authentication error: {str(e)}")
 
@@ -529,44 +621,27 @@ class MainWindow(QMainWindow):
 
         # Test connection
         try:
-            InfoBar.info(
-                title="Testing Connection",
-                content="Connecting to Freshservice...",
-                parent=self,
-                duration=2000,
-                position=InfoBarPosition.TOP_RIGHT
-            )
+            self._notify("info", "Testing Connection", "Connecting to Freshservice...", duration=2000)
 
             fs_service = FreshserviceAPIService(fs.domain, api_key)
             success, message = fs_service.test_connection()
 
             if success:
                 # Update state
-                from datetime import datetime
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.freshservice, 'is_connected', True)
-                )
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.freshservice, 'last_test_time', datetime.now())
-                )
+                self.state_store.set_freshservice_field('is_connected', True)
+                self.state_store.set_freshservice_field('last_test_time', datetime.now())
 
-                InfoBar.success(
-                    title="Connection Successful",
-                    content=message or "Successfully connected to Freshservice.",
-                    parent=self,
-                    duration=3000,
-                    position=InfoBarPosition.TOP_RIGHT
+                self._notify(
+                    "success",
+                    "Connection Successful",
+                    message or "Successfully connected to Freshservice."
                 )
             else:
-                self.state_store.update_connections(
-                    lambda s: setattr(s.connections.freshservice, 'is_connected', False)
-                )
+                self.state_store.set_freshservice_field('is_connected', False)
                 self._show_error(f"Connection failed: {message}")
 
         except Exception as e:
-            self.state_store.update_connections(
-                lambda s: setattr(s.connections.freshservice, 'is_connected', False)
-            )
+            self.state_store.set_freshservice_field('is_connected', False)
             self._show_error(f"Connection error: {str(e)}")
 
     def _on_preview_clicked(self):
@@ -612,6 +687,7 @@ class MainWindow(QMainWindow):
         # Clear existing drafts
         self.state_store.update_drafts(lambda s: s.clear_drafts())
         self.review_card.clear_table()
+        self.review_card.begin_streaming()
 
         # Hide any error banner
         self.error_banner.hide_banner()
@@ -637,16 +713,16 @@ class MainWindow(QMainWindow):
             self.review_card.clear_table()
             self.last_action_label.setText("Last: Cleared")
 
-            InfoBar.success(
-                title="Cleared",
-                content="All drafts have been cleared.",
-                parent=self,
-                duration=2000,
-                position=InfoBarPosition.TOP_RIGHT
-            )
+            self._notify("success", "Cleared", "All drafts have been cleared.", duration=2000)
 
     def _on_review_row_clicked(self, draft_id: int):
         """Handle review row click."""
+        if self.review_sheet is None:
+            self.review_sheet = ReviewDetailSheet(self.state_store, self)
+            self.review_sheet.setParent(self.centralWidget())
+            self.review_sheet.raise_()
+            self.review_sheet.mark_ready_clicked.connect(self._on_mark_draft_ready)
+
         self.review_sheet.show_draft(draft_id)
 
     def _on_view_all_details(self):
@@ -658,36 +734,29 @@ class MainWindow(QMainWindow):
             return
 
         # Create HTML file with all details
-        from datetime import datetime
         import webbrowser
-        import os
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ticket_details_{timestamp}.html"
-        filepath = os.path.join(os.path.expanduser("~"), "Desktop", filename)
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filepath = self._desktop_dir / f"ticket_details_{timestamp}.html"
 
         try:
-            html = self._generate_html_report(drafts)
+            html = self._generate_html_report(drafts, now)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with filepath.open('w', encoding='utf-8', buffering=1 << 16) as f:
                 f.write(html)
 
-            # Open in browser
-            webbrowser.open(f'file://{filepath}')
+            # Open in browser (as_uri handles Windows drive letters)
+            webbrowser.open(filepath.as_uri())
 
-            InfoBar.success(
-                title="Report Generated",
-                content=f"Opened {len(drafts)} tickets in browser.",
-                parent=self,
-                duration=3000,
-                position=InfoBarPosition.TOP_RIGHT
-            )
+            self._notify("success", "Report Generated", f"Opened {len(drafts)} tickets in browser.")
 
         except Exception as e:
             self._show_error(f"Failed to generate report: {str(e)}")
 
-    def _generate_html_report(self, drafts: list) -> str:
+    def _generate_html_report(self, drafts: list, generated_at: datetime = None) -> str:
         """Generate HTML report for all drafts."""
+        generated_at = generated_at or datetime.now()
         html = """<!DOCTYPE html>
 <html>
 <head>
@@ -716,40 +785,38 @@ class MainWindow(QMainWindow):
 <body>
     <h1>IT Ticket Email Generator - Draft Report</h1>
     <div class="summary">
-        <strong>Generated:</strong> """ + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """<br>
+        <strong>Generated:</strong> """ + generated_at.strftime("%Y-%m-%d %H:%M:%S") + """<br>
         <strong>Total Drafts:</strong> """ + str(len(drafts)) + """<br>
         <strong>Ready to Send:</strong> """ + str(sum(1 for d in drafts if d.status == EmailStatus.READY)) + """
     </div>
 """
 
+        parts = [html]
         for draft in drafts:
-            status_class = f"status-{draft.status.value.lower()}"
-            html += f"""
-    <div class="ticket">
-        <div class="ticket-header">
-            <span class="ticket-id">Ticket #{draft.id}</span>
-            <span class="status {status_class}">{draft.status.value.upper()}</span>
-        </div>
-        <div class="field"><span class="field-label">Type:</span><span class="field-value">{draft.type.value}</span></div>
-        <div class="field"><span class="field-label">Priority:</span><span class="field-value">{draft.priority}</span></div>
-        <div class="field"><span class="field-label">Category:</span><span class="field-value">{draft.category}</span></div>
-"""
+            optional_fields = ""
             if draft.subcategory:
-                html += f"""        <div class="field"><span class="field-label">Sub-Category:</span><span class="field-value">{draft.subcategory}</span></div>\n"""
+                optional_fields += _FIELD_TMPL(label="Sub-Category", value=escape(draft.subcategory))
             if draft.item:
-                html += f"""        <div class="field"><span class="field-label">Item:</span><span class="field-value">{draft.item}</span></div>\n"""
-
-            html += f"""        <div class="field"><span class="field-label">Recipient:</span><span class="field-value">{draft.recipient}</span></div>
-        <div class="subject">{draft.subject}</div>
-        <div class="body">{draft.body}</div>
-    </div>
-"""
-
-        html += """
+                optional_fields += _FIELD_TMPL(label="Item", value=escape(draft.item))
+
+            parts.append(_TICKET_TMPL(
+                id=draft.id,
+                status_class=f"status-{draft.status.value.lower()}",
+                status=escape(draft.status.value.upper()),
+                type=escape(draft.type.value),
+                priority=escape(draft.priority),
+                category=escape(draft.category),
+                optional_fields=optional_fields,
+                recipient=escape(str(draft.recipient)),
+                subject=escape(draft.subject),
+                body=escape(draft.body)
+            ))
+
+        parts.append("""
 </body>
 </html>
-"""
-        return html
+""")
+        return "".join(parts)
 
     def _on_export_csv(self):
         """Handle export CSV."""
@@ -772,13 +839,7 @@ class MainWindow(QMainWindow):
             try:
                 CSVExporter.export_drafts(drafts, file_path)
 
-                InfoBar.success(
-                    title="Exported",
-                    content=f"Exported {len(drafts)} drafts to {file_path}",
-                    parent=self,
-                    duration=3000,
-                    position=InfoBarPosition.TOP_RIGHT
-                )
+                self._notify("success", "Exported", f"Exported {len(drafts)} drafts to {file_path}")
 
                 self.last_action_label.setText(f"Last: Exported {len(drafts)} drafts")
 
@@ -795,39 +856,20 @@ class MainWindow(QMainWindow):
 
         # Mark as ready
         for draft_id in draft_ids:
-            self.state_store.update_drafts(
-                lambda s: s.update_draft_status(draft_id, EmailStatus.READY)
-            )
+            self.state_store.set_draft_status(draft_id, EmailStatus.READY)
 
-        InfoBar.success(
-            title="Marked Ready",
-            content=f"{len(draft_ids)} drafts marked as ready.",
-            parent=self,
-            duration=2000,
-            position=InfoBarPosition.TOP_RIGHT
-        )
+        self._notify("success", "Marked Ready", f"{len(draft_ids)} drafts marked as ready.", duration=2000)
 
     def _on_mark_draft_ready(self, draft_id: int):
         """Mark single draft as ready from detail sheet."""
-        self.state_store.update_drafts(
-            lambda s: s.update_draft_status(draft_id, EmailStatus.READY)
-        )
+        self.state_store.set_draft_status(draft_id, EmailStatus.READY)
 
-        self.activity_log.add_success(f"Marked draft #{draft_id} as ready")
+        self._log("success", f"Marked draft #{draft_id} as ready")
 
-        InfoBar.success(
-            title="Marked Ready",
-            content="Draft marked as ready.",
-            parent=self,
-            duration=2000,
-            position=InfoBarPosition.TOP_RIGHT
-        )
+        self._notify("success", "Marked Ready", "Draft marked as ready.", duration=2000)
 
     def _on_confirm_send(self):
         """Handle confirm send button - send all ready drafts."""
-        import time
-        from datetime import datetime
-
         # Get ready drafts
         ready_drafts = [d for d in self.state_store.state.drafts if d.status == EmailStatus.READY]
 
@@ -843,17 +885,17 @@ class MainWindow(QMainWindow):
         ).exec()
 
         if not result:
-            self.activity_log.add_warning("Send cancelled by user")
+            self._log("warning", "Send cancelled by user")
             return
 
         # Check authentication
         if not self.state_store.state.connections.microsoft.is_authenticated:
             self._show_error("Please authenticate with Microsoft 365 first.")
-            self.activity_log.add_error("Send failed: Not authenticated")
+            self._log("error", "Send failed: Not authenticated")
             return
 
         # Start sending
-        self.activity_log.add_info(f"Starting to send {len(ready_drafts)} emails...")
+        self._log("info", f"Starting to send {len(ready_drafts)} emails...")
         self.activity_log.set_status(f"Sending 0/{len(ready_drafts)}...", "busy")
 
         # Disable button during send
@@ -868,25 +910,18 @@ class MainWindow(QMainWindow):
         access_token = self.state_store.get_secret('microsoft_access_token')
         if not access_token:
             self._show_error("No access token found. Please authenticate again.")
-            self.activity_log.add_error("Send failed: No access token")
+            self._log("error", "Send failed: No access token")
             self.confirm_send_button.setEnabled(True)
             self.activity_log.set_status("Ready", "success")
             return
 
-        # Import email sender
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-        from email_sender import EmailSender
-
         # Create sender
         ms = self.state_store.state.connections.microsoft
         sender = EmailSender(access_token, ms.sender_email)
 
-        for draft in ready_drafts:
+        total = len(ready_drafts)
+        for index, draft in enumerate(ready_drafts, 1):
             try:
-                self.activity_log.add_info(f"Sending email #{draft.id}: {draft.subject[:50]}...")
-
                 # Actually send via Microsoft Graph API
                 result = sender.send_email(
                     to_email=draft.recipient,
@@ -896,23 +931,18 @@ class MainWindow(QMainWindow):
                 )
 
                 if result['success']:
-                    # Mark as sent
-                    self.state_store.update_drafts(
-                        lambda s: s.update_draft_status(draft.id, EmailStatus.SENT)
-                    )
-                    draft.sent_timestamp = datetime.now()
+                    # Mark as sent (one clock read per draft)
+                    now = datetime.now()
+                    self.state_store.set_draft_status(draft.id, EmailStatus.SENT, timestamp=now)
 
                     sent_count += 1
-                    self.activity_log.add_success(f"✓ Email #{draft.id} sent successfully")
-                    self.activity_log.set_status(f"Sending {sent_count}/{len(ready_drafts)}...", "busy")
+                    self.activity_log.set_status(f"Sending {sent_count}/{total}...", "busy")
                 else:
                     # Mark as error
                     failed_count += 1
                     error_msg = result.get('error', 'Unknown error')
-                    self.state_store.update_drafts(
-                        lambda s: s.update_draft_status(draft.id, EmailStatus.ERROR, error_msg)
-                    )
-                    self.activity_log.add_error(f"✗ Email #{draft.id} failed: {error_msg}")
+                    self.state_store.set_draft_status(draft.id, EmailStatus.ERROR, error_msg)
+                    self._log("error", f"✗ Email #{draft.id} failed: {error_msg}")
 
                 # Wait between sends
                 if wait_time_ms > 0:
@@ -920,44 +950,30 @@ class MainWindow(QMainWindow):
 
             except Exception as e:
                 failed_count += 1
-                self.state_store.update_drafts(
-                    lambda s: s.update_draft_status(draft.id, EmailStatus.ERROR, str(e))
-                )
-                self.activity_log.add_error(f"✗ Email #{draft.id} failed: {str(e)}")
+                self.state_store.set_draft_status(draft.id, EmailStatus.ERROR, str(e))
+                self._log("error", f"✗ Email #{draft.id} failed: {str(e)}")
+
+            # Log one progress line per batch of drafts rather than per draft
+            if index % self.SEND_LOG_INTERVAL == 0 and index < total:
+                self._log("info", f"Processed {index}/{total} emails ({sent_count} sent, {failed_count} failed)")
 
         # Complete
         self.confirm_send_button.setEnabled(True)
         self.activity_log.set_status("Send complete", "success")
 
         if failed_count == 0:
-            self.activity_log.add_success(f"All {sent_count} emails sent successfully!")
+            self._log("success", f"All {sent_count} emails sent successfully!")
             self.last_action_label.setText(f"Last: Sent {sent_count} emails")
 
-            InfoBar.success(
-                title="Send Complete",
-                content=f"Successfully sent {sent_count} emails.",
-                parent=self,
-                duration=3000,
-                position=InfoBarPosition.TOP_RIGHT
-            )
+            self._notify("success", "Send Complete", f"Successfully sent {sent_count} emails.")
         else:
-            self.activity_log.add_warning(f"Sent {sent_count}, Failed {failed_count}")
+            self._log("warning", f"Sent {sent_count}, Failed {failed_count}")
             self.last_action_label.setText(f"Last: Sent {sent_count}, Failed {failed_count}")
 
-            InfoBar.warning(
-                title="Send Partial",
-                content=f"Sent {sent_count} emails, {failed_count} failed.",
-                parent=self,
-                duration=3000,
-                position=InfoBarPosition.TOP_RIGHT
-            )
+            self._notify("warning", "Send Partial", f"Sent {sent_count} emails, {failed_count} failed.")
 
     def _on_verify_tickets(self):
         """Handle verify tickets button - verify sent emails created Freshservice tickets."""
-        from datetime import datetime
-        import sys
-        from pathlib import Path
-
         # Get sent drafts
         sent_drafts = [d for d in self.state_store.state.drafts if d.status == EmailStatus.SENT]
 
@@ -969,188 +985,244 @@ class MainWindow(QMainWindow):
         fs = self.state_store.state.connections.freshservice
         if not fs.is_connected:
             self._show_error("Please connect to Freshservice first.")
-            self.activity_log.add_error("Verification failed: Freshservice not connected")
+            self._log("error", "Verification failed: Freshservice not connected")
             return
 
         # Get API key
         fs_api_key = self.state_store.get_secret('freshservice_api_key')
         if not fs_api_key:
             self._show_error("Freshservice API key not found.")
-            self.activity_log.add_error("Verification failed: No API key")
+            self._log("error", "Verification failed: No API key")
             return
 
         # Start verification
-        self.activity_log.add_info(f"Starting verification for {len(sent_drafts)} sent emails...")
+        self._log("info", f"Starting verification for {len(sent_drafts)} sent emails...")
         self.activity_log.set_status("Verifying...", "busy")
         self.verify_button.setEnabled(False)
         self.last_action_label.setText("Last: Verifying tickets...")
 
-        try:
-            # Import required modules
-            sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-            from freshservice_client import FreshserviceClient
-            from ticket_verifier import TicketVerifier
-
-            # Create clients
-            fs_client = FreshserviceClient(fs.domain, fs_api_key)
-            verifier = TicketVerifier(fs_client)
-
-            # Prepare sent emails data
-            sent_emails_data = []
-            batch_start_time = None
-
-            for draft in sent_drafts:
-                # Get the earliest sent timestamp as batch start time
-                if draft.sent_timestamp:
-                    if batch_start_time is None or draft.sent_timestamp < batch_start_time:
-                        batch_start_time = draft.sent_timestamp
-
-                # Build email data for verifier
-                sent_emails_data.append({
-                    'number': draft.id,
-                    'subject': draft.subject,
-                    'priority': draft.priority,
-                    'type': draft.type.value,
-                    'category': f"{draft.category} > {draft.subcategory} > {draft.item}".strip(' > ')
-                })
-
-            # Default to now if no timestamps
-            if batch_start_time is None:
-                batch_start_time = datetime.now()
-
-            self.activity_log.add_info(f"Batch start time: {batch_start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Get sender email
-            ms = self.state_store.state.connections.microsoft
-            sender_email = str(ms.sender_email) if ms.sender_email else None
-
-            # Verify batch
-            self.activity_log.add_info("Querying Freshservice API...")
-            verification_results = verifier.verify_batch(
-                sent_emails=sent_emails_data,
-                recipient_email=str(ms.recipient_email) if ms.recipient_email else "unknown",
-                batch_start_time=batch_start_time,
-                sender_email=sender_email
-            )
+        # Earliest sent timestamp is the batch start time (default to now)
+        batch_start_time = min(
+            (d.sent_timestamp for d in sent_drafts if d.sent_timestamp),
+            default=datetime.now()
+        )
 
-            # Process results
-            summary = verification_results['summary']
-            found_count = verification_results['total_found']
-            not_found_count = verification_results['total_not_found']
-            passed_count = summary['passed']
-            failed_count = summary['failed']
-
-            # Log detailed results
-            self.activity_log.add_info(f"Found {found_count}/{len(sent_drafts)} tickets in Freshservice")
-
-            for result in verification_results['results']:
-                ticket_num = result['ticket_number']
-                status = result['status']
-                overall = result['overall_result']
-
-                if status == 'NOT_FOUND':
-                    self.activity_log.add_error(f"✗ Ticket #{ticket_num}: NOT FOUND in Freshservice")
-                elif overall == 'PASS':
-                    self.activity_log.add_success(f"✓ Ticket #{ticket_num}: PASS (all fields match)")
-                elif overall == 'FAIL':
-                    match_count = result['match_count']
-                    mismatch_count = result['mismatch_count']
-                    self.activity_log.add_warning(f"⚠ Ticket #{ticket_num}: FAIL ({match_count} match, {mismatch_count} mismatch)")
-
-            # Summary
-            pass_rate = summary['pass_rate']
-            self.activity_log.add_info(f"Pass rate: {pass_rate:.1f}% ({passed_count}/{found_count})")
-
-            # Show final result
-            self.verify_button.setEnabled(True)
-            self.activity_log.set_status("Verification complete", "success")
-            self.last_action_label.setText(f"Last: Verified {found_count} tickets")
-
-            # Show detailed results dialog
-            from .verification_dialog import VerificationDialog
-            dialog = VerificationDialog(verification_results, self)
-            dialog.show()
-
-            if not_found_count == 0 and failed_count == 0:
-                InfoBar.success(
-                    title="Verification Complete",
-                    content=f"All {found_count} tickets verified successfully!",
-                    parent=self,
-                    duration=3000,
-                    position=InfoBarPosition.TOP_RIGHT
-                )
-            elif not_found_count > 0:
-                InfoBar.warning(
-                    title="Verification Partial",
-                    content=f"{not_found_count} tickets not found in Freshservice. See details window.",
-                    parent=self,
-                    duration=5000,
-                    position=InfoBarPosition.TOP_RIGHT
-                )
-            else:
-                InfoBar.warning(
-                    title="Verification Complete",
-                    content=f"{passed_count} passed, {failed_count} failed. See details window.",
-                    parent=self,
-                    duration=5000,
-                    position=InfoBarPosition.TOP_RIGHT
-                )
+        # Build email data for verifier
+        sent_emails_data = [
+            {
+                'number': draft.id,
+                'subject': draft.subject,
+                'priority': draft.priority,
+                'type': draft.type.value,
+                'category': " > ".join(p for p in (draft.category, draft.subcategory, draft.item) if p)
+            }
+            for draft in sent_drafts
+        ]
 
-        except Exception as e:
-            self.verify_button.setEnabled(True)
-            self.activity_log.add_error(f"Verification error: {str(e)}")
-            self.activity_log.set_status("Ready", "success")
-            self._show_error(f"Verification failed: {str(e)}")
+        self._log("info", f"Batch start time: {batch_start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # Get sender email
+        ms = self.state_store.state.connections.microsoft
+        sender_email = str(ms.sender_email) if ms.sender_email else None
+
+        # Verify batch in the background
+        self._log("info", "Querying Freshservice API...")
+        self._verify_sent_count = len(sent_drafts)
+        self.review_card.show_progress("Verifying Tickets", len(sent_drafts))
+        self.verifier_service.verify_tickets(
+            domain=fs.domain,
+            api_key=fs_api_key,
+            sent_emails=sent_emails_data,
+            recipient_email=str(ms.recipient_email) if ms.recipient_email else "unknown",
+            batch_start_time=batch_start_time,
+            sender_email=sender_email
+        )
+
+    def _on_verification_result(self, result: dict):
+        """Queue the log line for a streamed verification result."""
+        ticket_num = result['ticket_number']
+        status = result['status']
+        overall = result['overall_result']
+
+        if status == 'NOT_FOUND':
+            entry = ("error", f"✗ Ticket #{ticket_num}: NOT FOUND in Freshservice")
+        elif overall == 'PASS':
+            entry = ("success", f"✓ Ticket #{ticket_num}: PASS (all fields match)")
+        elif overall == 'FAIL':
+            match_count = result['match_count']
+            mismatch_count = result['mismatch_count']
+            entry = ("warning", f"⚠ Ticket #{ticket_num}: FAIL ({match_count} match, {mismatch_count} mismatch)")
+        else:
+            return
+
+        self._pending_verify_log.append(entry)
+        if not self._verify_timer.isActive():
+            self._verify_timer.start()
+
+    def _on_verification_progress(self, current: int, total: int):
+        """Record verification progress (applied by _flush_verification)."""
+        self._verify_progress = (current, total)
+        if not self._verify_timer.isActive():
+            self._verify_timer.start()
+
+    def _flush_verification(self):
+        """Write queued verification log lines and the latest progress."""
+        self._verify_timer.stop()
+
+        entries, self._pending_verify_log = self._pending_verify_log, []
+        self._log_batch(entries)
+
+        if self._verify_progress is not None:
+            current, total = self._verify_progress
+            self._verify_progress = None
+            self.review_card.update_progress(current, f"Verified {current} of {total} tickets")
+
+    def _discard_pending_verification(self):
+        """Drop queued verification output (after cancel or error)."""
+        self._verify_timer.stop()
+        self._pending_verify_log = []
+        self._verify_progress = None
+
+    def _on_verification_done(self, verification_results: dict):
+        """Handle verification results from the verifier service."""
+        self._flush_verification()
+        self.review_card.hide_progress()
+
+        # Process results
+        summary = verification_results['summary']
+        found_count = verification_results['total_found']
+        not_found_count = verification_results['total_not_found']
+        passed_count = summary['passed']
+        failed_count = summary['failed']
+
+        # Summary (per-ticket lines were logged as results streamed in)
+        pass_rate = summary['pass_rate']
+        self._log_batch([
+            ("info", f"Found {found_count}/{self._verify_sent_count} tickets in Freshservice"),
+            ("info", f"Pass rate: {pass_rate:.1f}% ({passed_count}/{found_count})"),
+        ])
+
+        # Show final result
+        self.verify_button.setEnabled(True)
+        self.activity_log.set_status("Verification complete", "success")
+        self.last_action_label.setText(f"Last: Verified {found_count} tickets")
+
+        # Show detailed results dialog
+        from .verification_dialog import VerificationDialog
+        dialog = VerificationDialog(verification_results, self)
+        dialog.show()
+
+        if not_found_count == 0 and failed_count == 0:
+            self._notify(
+                "success",
+                "Verification Complete",
+                f"All {found_count} tickets verified successfully!"
+            )
+        elif not_found_count > 0:
+            self._notify(
+                "warning",
+                "Verification Partial",
+                f"{not_found_count} tickets not found in Freshservice. See details window.",
+                duration=5000
+            )
+        else:
+            self._notify(
+                "warning",
+                "Verification Complete",
+                f"{passed_count} passed, {failed_count} failed. See details window.",
+                duration=5000
+            )
+
+    def _on_verification_error(self, error_message: str):
+        """Handle verification failure from the verifier service."""
+        self._discard_pending_verification()
+        self.review_card.hide_progress()
+        self.verify_button.setEnabled(True)
+        self._log("error", f"Verification error: {error_message}")
+        self.activity_log.set_status("Ready", "success")
+        self._show_error(f"Verification failed: {error_message}")
 
     def _on_draft_generated(self, draft):
-        """Handle draft generated signal."""
+        """Handle draft generated signal (coalesced, see _flush_drafts)."""
+        self._pending_drafts.append(draft)
+        if not self._draft_timer.isActive():
+            self._draft_timer.start()
+
+    def _flush_drafts(self):
+        """Add streamed drafts to state, table and log in one batch."""
+        self._draft_timer.stop()
+        if not self._pending_drafts:
+            return
+        drafts, self._pending_drafts = self._pending_drafts, []
+
         # Add to state
-        self.state_store.update_drafts(lambda s: s.add_draft(draft))
+        self.state_store.add_drafts(drafts)
 
         # Add to table (streaming)
-        self.review_card.add_draft_row(draft)
+        self.review_card.add_draft_rows(drafts)
 
         # Update next ticket number
+        next_number = drafts[-1].id + 1
         self.state_store.update_state(
-            lambda s: setattr(s.generation, 'next_ticket_number', draft.id + 1)
+            lambda s: setattr(s.generation, 'next_ticket_number', next_number)
         )
 
         # Log
-        self.activity_log.add_success(f"Generated draft #{draft.id}: {draft.subject[:40]}...")
+        self._log_batch([
+            ("success", f"Generated draft #{draft.id}: {draft.subject[:40]}...")
+            for draft in drafts
+        ])
 
     def _on_progress_updated(self, current: int, total: int):
-        """Handle progress update."""
+        """Handle progress update (applied at most every PROGRESS_FLUSH_MS)."""
+        self._progress_pending = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the latest pending progress update."""
+        if self._progress_pending is None:
+            return
+        current, total = self._progress_pending
+        self._progress_pending = None
+
         self.last_action_label.setText(f"Last: Generating {current}/{total}...")
         self.activity_log.set_status(f"Generating {current}/{total}...", "busy")
         # Update enhanced progress card
         self.review_card.update_progress(current, f"Generated {current} of {total} emails")
 
+    def _discard_pending_progress(self):
+        """Drop any progress update still waiting for the throttle timer."""
+        self._progress_timer.stop()
+        self._progress_pending = None
+
     def _on_generation_complete(self):
         """Handle generation complete."""
+        self._discard_pending_progress()
         self.generation_card.set_generation_enabled(True)
         self.review_card.hide_progress()
 
+        # Add any buffered drafts before counting them
+        self._flush_drafts()
+        self.review_card.end_streaming()
+
         count = len(self.state_store.state.drafts)
         self.last_action_label.setText(f"Last: Generated {count} drafts")
-
-        self.activity_log.add_success(f"Generation complete: {count} drafts created")
+        self._log("success", f"Generation complete: {count} drafts created")
         self.activity_log.set_status("Ready", "success")
 
-        InfoBar.success(
-            title="Generation Complete",
-            content=f"Successfully generated {count} drafts.",
-            parent=self,
-            duration=3000,
-            position=InfoBarPosition.TOP_RIGHT
-        )
+        self._notify("success", "Generation Complete", f"Successfully generated {count} drafts.")
 
     def _on_generation_error(self, error_message: str):
         """Handle generation error."""
+        self._discard_pending_progress()
         self.generation_card.set_generation_enabled(True)
         self.review_card.hide_progress()
         self.last_action_label.setText("Last: Error")
 
-        self.activity_log.add_error(f"Generation failed: {error_message}")
+        self._flush_drafts()
+        self.review_card.end_streaming()
+        self._log("error", f"Generation failed: {error_message}")
         self.activity_log.set_status("Ready", "success")
 
         # Show error banner with retry option instead of blocking dialog
@@ -1160,16 +1232,43 @@ class MainWindow(QMainWindow):
         )
 
     def _on_drafts_changed(self, drafts):
-        """Handle drafts list change."""
-        self.drafts_count_label.setText(f"Drafts: {len(drafts)}")
+        """Resync draft counters after a bulk drafts change (load/clear)."""
+        status_counts = Counter(d.status for d in drafts)
+        self._drafts_count = len(drafts)
+        self._ready_count = status_counts[EmailStatus.READY]
+        self._sent_count = status_counts[EmailStatus.SENT]
+        self._apply_draft_counts()
+
+    def _on_draft_added(self, draft):
+        """Update draft counters for a single added draft."""
+        self._drafts_count += 1
+        if draft.status == EmailStatus.READY:
+            self._ready_count += 1
+        elif draft.status == EmailStatus.SENT:
+            self._sent_count += 1
+        self._apply_draft_counts()
+
+    def _on_draft_status_changed(self, draft, old_status, new_status):
+        """Update draft counters for a single status change."""
+        self._ready_count += (new_status == EmailStatus.READY) - (old_status == EmailStatus.READY)
+        self._sent_count += (new_status == EmailStatus.SENT) - (old_status == EmailStatus.SENT)
+        self._apply_draft_counts()
+
+    def _apply_draft_counts(self):
+        """Push draft counters to the footer label and action buttons."""
+        if self._drafts_count != self._shown_drafts_count:
+            self._shown_drafts_count = self._drafts_count
+            self.drafts_count_label.setText(f"Drafts: {self._drafts_count}")
 
         # Enable "Confirm Send" button if there are ready drafts
-        ready_count = sum(1 for d in drafts if d.status == EmailStatus.READY)
-        self.confirm_send_button.setEnabled(ready_count > 0)
+        has_ready = self._ready_count > 0
+        if self.confirm_send_button.isEnabled() != has_ready:
+            self.confirm_send_button.setEnabled(has_ready)
 
         # Enable "Verify Tickets" button if there are sent drafts
-        sent_count = sum(1 for d in drafts if d.status == EmailStatus.SENT)
-        self.verify_button.setEnabled(sent_count > 0)
+        has_sent = self._sent_count > 0
+        if self.verify_button.isEnabled() != has_sent:
+            self.verify_button.setEnabled(has_sent)
 
     def _on_connections_changed(self, connections):
         """Handle connections state change."""
@@ -1259,11 +1358,14 @@ class MainWindow(QMainWindow):
         return key
 
     def _get_generation_settings(self) -> dict:
-        """Get generation settings from state."""
+        """Get generation settings from state (cached until settings change)."""
+        if self._cached_settings is not None:
+            return self._cached_settings
+
         gen = self.state_store.state.generation
         ms = self.state_store.state.connections.microsoft
 
-        return {
+        self._cached_settings = {
             'email_count': gen.email_count,
             'quality': gen.quality,
             'wait_time_ms': gen.wait_time_ms,
@@ -1272,6 +1374,96 @@ class MainWindow(QMainWindow):
             'next_ticket_number': gen.next_ticket_number,
             'recipient_email': str(ms.recipient_email)
         }
+        return self._cached_settings
+
+    def _invalidate_generation_settings(self, *args):
+        """Drop cached generation settings so the next read rebuilds them."""
+        self._cached_settings = None
+
+    def _notify(
+        self,
+        level: str,
+        title: str,
+        content: str,
+        duration: int = 3000,
+        position: InfoBarPosition = InfoBarPosition.TOP_RIGHT
+    ):
+        """
+        Show an InfoBar notification, replacing a visible bar of the same kind.
+
+        Args:
+            level: InfoBar level (success, info, warning, error)
+            title: Notification title
+            content: Notification content
+            duration: Display duration in milliseconds
+            position: InfoBar position
+        """
+        key = (level, position)
+        old_bar = self._infobar_pool.pop(key, None)
+        if old_bar is not None:
+            # Close the bar already on screen instead of stacking another
+            old_bar.close()
+
+        bar = getattr(InfoBar, level)(
+            title=title,
+            content=content,
+            parent=self,
+            duration=duration,
+            position=position
+        )
+        bar.closedSignal.connect(lambda key=key, bar=bar: self._release_infobar(key, bar))
+        self._infobar_pool[key] = bar
+
+    def _release_infobar(self, key: tuple, bar: InfoBar):
+        """Drop a closed InfoBar from the pool."""
+        if self._infobar_pool.get(key) is bar:
+            del self._infobar_pool[key]
+
+    def _log(self, level: str, message: str):
+        """
+        Write to the activity log, buffering while it is not visible.
+
+        Args:
+            level: Log level (info, success, warning, error)
+            message: Log message
+        """
+        if self.isMinimized() or not self.activity_log.isVisible():
+            self._pending_log.append((level, message, datetime.now()))
+            return
+        self.activity_log.add_log(message, level)
+
+    def _log_batch(self, entries: list):
+        """
+        Write several (level, message) entries to the activity log at once.
+
+        Args:
+            entries: (level, message) tuples
+        """
+        if self.isMinimized() or not self.activity_log.isVisible():
+            now = datetime.now()
+            self._pending_log.extend((level, message, now) for level, message in entries)
+            return
+        self.activity_log.add_batch(entries)
+
+    def _flush_pending_log(self):
+        """Write buffered log entries in one batch."""
+        if not self._pending_log or self.isMinimized() or not self.activity_log.isVisible():
+            return
+
+        entries = list(self._pending_log)
+        self._pending_log.clear()
+        self.activity_log.add_batch(entries)
+
+    def showEvent(self, event):
+        """Flush buffered log entries once the window is shown."""
+        super().showEvent(event)
+        self._flush_pending_log()
+
+    def changeEvent(self, event):
+        """Flush buffered log entries when the window is restored."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._flush_pending_log()
 
     def _show_error(self, message: str):
         """Show error message."""
@@ -22,6 +22,13 @@ class OnboardingDialog(QDialog):
     5. Ready to start summary
     """
 
+    # Label sizes, selected per label with the "role" property
+    _QSS = (
+        "QLabel[role='hero'] { font-size: 64px; }"
+        "QLabel[role='title'] { font-size: 24px; }"
+        "QLabel[role='icon'] { font-size: 32px; }"
+    )
+
     def __init__(self, parent=None):
         """
         Initialize onboarding dialog.
@@ -33,6 +40,7 @@ class OnboardingDialog(QDialog):
         self.setWindowTitle("Welcome to IT Ticket Email Generator")
         self.setFixedSize(600, 450)
         self.setModal(True)
+        self.setStyleSheet(self._QSS)
 
         self._setup_ui()
 
@@ -42,13 +50,21 @@ class OnboardingDialog(QDialog):
         layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(24)
 
-        # Stacked pages
+        # Stacked pages (only the welcome page is built up front; the rest
+        # are placeholders replaced on first visit)
+        self._page_factories = [
+            self._create_welcome_page,
+            self._create_microsoft_page,
+            self._create_claude_page,
+            self._create_freshservice_page,
+            self._create_ready_page,
+        ]
+        self._built_pages = {0}
+
         self._pages = QStackedWidget()
         self._pages.addWidget(self._create_welcome_page())
-        self._pages.addWidget(self._create_microsoft_page())
-        self._pages.addWidget(self._create_claude_page())
-        self._pages.addWidget(self._create_freshservice_page())
-        self._pages.addWidget(self._create_ready_page())
+        for _ in self._page_factories[1:]:
+            self._pages.addWidget(QWidget())
         layout.addWidget(self._pages)
 
         # Navigation buttons
@@ -81,13 +97,13 @@ class OnboardingDialog(QDialog):
 
         # Icon
         icon = SubtitleLabel("\U0001F4E7")  # Envelope emoji
-        icon.setStyleSheet("font-size: 64px;")
+        icon.setProperty("role", "hero")
         icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon)
 
         # Title
         title = SubtitleLabel("Welcome!")
-        title.setStyleSheet("font-size: 24px;")
+        title.setProperty("role", "title")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -114,7 +130,7 @@ class OnboardingDialog(QDialog):
 
         # Icon
         icon = SubtitleLabel("\U0001F4BB")  # Computer emoji
-        icon.setStyleSheet("font-size: 32px;")
+        icon.setProperty("role", "icon")
         layout.addWidget(icon)
 
         # Description
@@ -146,7 +162,7 @@ class OnboardingDialog(QDialog):
 
         # Icon
         icon = SubtitleLabel("\U0001F916")  # Robot emoji
-        icon.setStyleSheet("font-size: 32px;")
+        icon.setProperty("role", "icon")
         layout.addWidget(icon)
 
         # Description
@@ -179,7 +195,7 @@ class OnboardingDialog(QDialog):
 
         # Icon
         icon = SubtitleLabel("\U0001F3AB")  # Ticket emoji
-        icon.setStyleSheet("font-size: 32px;")
+        icon.setProperty("role", "icon")
         layout.addWidget(icon)
 
         # Description
@@ -208,13 +224,13 @@ class OnboardingDialog(QDialog):
 
         # Icon
         icon = SubtitleLabel("\u2705")  # Checkmark emoji
-        icon.setStyleSheet("font-size: 64px;")
+        icon.setProperty("role", "hero")
         icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon)
 
         # Title
         title = SubtitleLabel("You're Ready!")
-        title.setStyleSheet("font-size: 24px;")
+        title.setProperty("role", "title")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -240,15 +256,24 @@ class OnboardingDialog(QDialog):
 
         return page
 
+    def _ensure_page(self, index: int):
+        """Build the page at index if it is still a placeholder."""
+        if index in self._built_pages:
+            return
+
+        placeholder = self._pages.widget(index)
+        self._pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._pages.insertWidget(index, self._page_factories[index]())
+        self._built_pages.add(index)
+
     def _go_next(self):
         """Go to the next page."""
         current = self._pages.currentIndex()
         if current < self._pages.count() - 1:
+            self._ensure_page(current + 1)
             self._pages.setCurrentIndex(current + 1)
-            self._back_button.setVisible(True)
-            if current + 1 == self._pages.count() - 1:
-                self._next_button.setText("Get Started")
-                self._skip_button.setVisible(False)
+            self._update_nav_buttons(current + 1)
         else:
             self.accept()
 
@@ -257,7 +282,20 @@ class OnboardingDialog(QDialog):
         current = self._pages.currentIndex()
         if current > 0:
             self._pages.setCurrentIndex(current - 1)
-            self._next_button.setText("Next")
-            self._skip_button.setVisible(True)
-            if current - 1 == 0:
-                self._back_button.setVisible(False)
+            self._update_nav_buttons(current - 1)
+
+    def _update_nav_buttons(self, index: int):
+        """Sync navigation buttons to the page index, touching only what changed."""
+        is_last = index == self._pages.count() - 1
+
+        show_back = index > 0
+        if self._back_button.isHidden() == show_back:
+            self._back_button.setVisible(show_back)
+
+        show_skip = not is_last
+        if self._skip_button.isHidden() == show_skip:
+            self._skip_button.setVisible(show_skip)
+
+        next_text = "Get Started" if is_last else "Next"
+        if self._next_button.text() != next_text:
+            self._next_button.setText(next_text)
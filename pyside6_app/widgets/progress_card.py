@@ -25,6 +25,9 @@ class ProgressCard(SimpleCardWidget):
 
     cancel_clicked = Signal()
 
+    # Minimum seconds between ETA label refreshes
+    ETA_REFRESH_INTERVAL = 0.1
+
     def __init__(self, parent: QWidget = None):
         """
         Initialize progress card.
@@ -36,6 +39,12 @@ class ProgressCard(SimpleCardWidget):
         self._start_time = None
         self._total = 0
         self._current = 0
+        self._last_eta_time = 0.0
+
+        # Last values written to the widgets (skip redundant setters)
+        self._last_percentage = -1
+        self._last_eta_seconds = -1
+        self._indeterminate = False
 
         self._setup_ui()
         self.setVisible(False)
@@ -93,8 +102,11 @@ class ProgressCard(SimpleCardWidget):
         self._title_label.setText(title)
         self._total = total
         self._current = 0
-        self._start_time = time.time()
-        self._progress_bar.setRange(0, 100)
+        self._start_time = time.monotonic()
+        self._last_eta_time = 0.0
+        self._last_percentage = 0
+        self._last_eta_seconds = -1
+        self._set_determinate()
         self._progress_bar.setValue(0)
         self._status_label.setText(f"0 of {total}")
         self._eta_label.setText("Calculating...")
@@ -110,24 +122,33 @@ class ProgressCard(SimpleCardWidget):
             current: Current progress count
             status_text: Optional custom status text
         """
-        if self._total <= 0:
+        total = self._total
+        if total <= 0:
             return
 
         self._current = current
-        percentage = int((current / self._total) * 100)
-        self._progress_bar.setValue(percentage)
+        self._set_determinate()
+        percentage = (current * 100) // total
+        if percentage != self._last_percentage:
+            self._last_percentage = percentage
+            self._progress_bar.setValue(percentage)
 
         if status_text:
             self._status_label.setText(status_text)
         else:
-            self._status_label.setText(f"{current} of {self._total}")
+            self._status_label.setText(f"{current} of {total}")
 
-        # Calculate ETA
+        # Calculate ETA (throttled, but always on the final update)
         if current > 0 and self._start_time:
-            elapsed = time.time() - self._start_time
-            rate = current / elapsed
-            remaining = (self._total - current) / rate if rate > 0 else 0
-            self._eta_label.setText(f"~{self._format_time(remaining)} remaining")
+            now = time.monotonic()
+            if now - self._last_eta_time < self.ETA_REFRESH_INTERVAL and current < total:
+                return
+            self._last_eta_time = now
+            elapsed = now - self._start_time
+            remaining_int = int((total - current) * elapsed / current)
+            if remaining_int != self._last_eta_seconds:
+                self._last_eta_seconds = remaining_int
+                self._eta_label.setText(f"~{self._format_time(remaining_int)} remaining")
 
     def show_indeterminate(self, message: str):
         """
@@ -137,8 +158,13 @@ class ProgressCard(SimpleCardWidget):
             message: Message to display
         """
         self._title_label.setText(message)
-        self._progress_bar.setRange(0, 0)  # Indeterminate mode
-        self._status_label.setText("Please wait...")
+        if not self._indeterminate:
+            self._progress_bar.setRange(0, 0)  # Indeterminate mode
+            self._indeterminate = True
+        self._last_percentage = -1
+        self._last_eta_seconds = -1
+        if self._status_label.text() != "Please wait...":
+            self._status_label.setText("Please wait...")
         self._eta_label.setText("")
         self._cancel_button.setEnabled(True)
         self._cancel_button.setText("Cancel")
@@ -151,19 +177,34 @@ class ProgressCard(SimpleCardWidget):
         Args:
             message: Completion message to display
         """
-        self._progress_bar.setRange(0, 100)
+        self._set_determinate()
         self._progress_bar.setValue(100)
+        self._last_percentage = 100
+        self._last_eta_seconds = -1
         self._status_label.setText(message)
         self._eta_label.setText("")
         self._cancel_button.setEnabled(False)
         self._cancel_button.setText("Done")
 
+    def _set_determinate(self):
+        """Switch the progress bar back to a 0-100 range if indeterminate."""
+        if self._indeterminate:
+            self._progress_bar.setRange(0, 100)
+            self._indeterminate = False
+
     def hide_progress(self):
         """Hide the progress card and reset state."""
+        if self.isHidden() and self._start_time is None:
+            return
+
         self.setVisible(False)
         self._cancel_button.setEnabled(True)
-        self._cancel_button.setText("Cancel")
-        self._progress_bar.setValue(0)
+        if self._cancel_button.text() != "Cancel":
+            self._cancel_button.setText("Cancel")
+        if self._progress_bar.value() != 0:
+            self._progress_bar.setValue(0)
+        self._last_percentage = 0
+        self._last_eta_seconds = -1
         self._start_time = None
 
     def _format_time(self, seconds: float) -> str:
@@ -176,16 +217,13 @@ class ProgressCard(SimpleCardWidget):
         Returns:
             Formatted time string
         """
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            mins = int(seconds / 60)
-            secs = int(seconds % 60)
-            return f"{mins}m {secs}s"
-        else:
-            hours = int(seconds / 3600)
-            mins = int((seconds % 3600) / 60)
+        hours, rem = divmod(int(seconds), 3600)
+        mins, secs = divmod(rem, 60)
+        if hours:
             return f"{hours}h {mins}m"
+        if mins:
+            return f"{mins}m {secs}s"
+        return f"{secs}s"
 
     def get_elapsed_time(self) -> float:
         """
@@ -195,7 +233,7 @@ class ProgressCard(SimpleCardWidget):
             Elapsed time in seconds, or 0 if not started
         """
         if self._start_time:
-            return time.time() - self._start_time
+            return time.monotonic() - self._start_time
         return 0
 
     def get_progress_percentage(self) -> int:
@@ -207,4 +245,4 @@ class ProgressCard(SimpleCardWidget):
         """
         if self._total <= 0:
             return 0
-        return int((self._current / self._total) * 100)
+        return (self._current * 100) // self._total
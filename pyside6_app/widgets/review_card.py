@@ -2,13 +2,13 @@
 Review card with draft table and bulk actions.
 """
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractTableModel, QModelIndex, QSize
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidgetItem, QHeaderView,
+    QWidget, QVBoxLayout, QHBoxLayout, QHeaderView,
     QScrollArea, QSizePolicy
 )
 from qfluentwidgets import (
-    ElevatedCardWidget, TableWidget, PushButton, IndeterminateProgressBar,
+    ElevatedCardWidget, TableView, PushButton, IndeterminateProgressBar,
     SubtitleLabel, CaptionLabel, FluentIcon, Action, RoundMenu
 )
 
@@ -18,6 +18,238 @@ from .progress_card import ProgressCard
 from .empty_state import EmptyState
 
 
+# Status column text, formatted once instead of per row
+_STATUS_DISPLAY = {
+    EmailStatus.DRAFT: "📝 Draft",
+    EmailStatus.READY: "✅ Ready",
+    EmailStatus.SENT: "✓ Sent",
+    EmailStatus.ERROR: "✖ Error",
+}
+
+_HEADERS = ("ID", "Type", "Priority", "Category", "Subject", "Status", "Recipient")
+# Fixed column widths - optimized for smaller screens (None stretches)
+_COLUMN_WIDTHS = (40, 70, 70, 100, None, 60, 150)
+_SUBJECT_COLUMN = 4
+_STATUS_COLUMN = 5
+
+
+def _status_text(status: EmailStatus) -> str:
+    """Get the status column text for a status."""
+    return _STATUS_DISPLAY.get(status) or "• " + status.value.title()
+
+
+def _format_columns(drafts: list) -> list:
+    """
+    Build the cell texts for drafts, one list per column.
+
+    Args:
+        drafts: List of DraftEmail objects
+
+    Returns:
+        List of per-column text lists
+    """
+    return [
+        [str(d.id) for d in drafts],
+        [d.type.value for d in drafts],
+        [d.priority for d in drafts],
+        [
+            d.category
+            + (f" > {d.subcategory}" if d.subcategory else "")
+            + (f" > {d.item}" if d.item else "")
+            for d in drafts
+        ],
+        [d.subject for d in drafts],  # Elided by the view at paint time
+        [_status_text(d.status) for d in drafts],
+        [d.recipient for d in drafts],  # EmailStr validates to a plain str
+    ]
+
+
+class DraftTableModel(QAbstractTableModel):
+    """
+    Table model over a list of drafts.
+
+    Rows are exposed in FETCH_BATCH chunks as the view scrolls (fetchMore),
+    and cell texts are formatted once per change, only for exposed rows.
+    """
+
+    FETCH_BATCH = 100  # Rows formatted and exposed per fetchMore
+
+    def __init__(self, parent=None):
+        """
+        Initialize draft table model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._drafts = []  # All drafts, in row order
+        self._columns = [[] for _ in _HEADERS]  # Formatted cell texts per column (exposed rows)
+        self._row_index = {}  # draft_id -> row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of exposed rows (0 for child indexes)."""
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of columns (0 for child indexes)."""
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def draft_count(self) -> int:
+        """Number of drafts, including rows not fetched yet."""
+        return len(self._drafts)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Whether drafts remain beyond the exposed rows."""
+        return not parent.isValid() and len(self._columns[0]) < len(self._drafts)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        """Expose the next FETCH_BATCH rows."""
+        if self.canFetchMore(parent):
+            self._expose(len(self._columns[0]) + self.FETCH_BATCH)
+
+    def fetch_all(self):
+        """Expose every row (e.g. before selecting all)."""
+        if self.canFetchMore():
+            self._expose(len(self._drafts))
+
+    def _expose(self, end: int):
+        """Format and insert rows up to end."""
+        first = len(self._columns[0])
+        end = min(end, len(self._drafts))
+        self.beginInsertRows(QModelIndex(), first, end - 1)
+        for column, texts in zip(self._columns, _format_columns(self._drafts[first:end])):
+            column.extend(texts)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Cell text, draft ID (UserRole), full subject tooltip and ID alignment."""
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._drafts[index.row()].id
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == _SUBJECT_COLUMN:
+            return self._columns[_SUBJECT_COLUMN][index.row()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 0:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Column titles, fixed column size hints and row numbers."""
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return _HEADERS[section]
+            if role == Qt.ItemDataRole.SizeHintRole and _COLUMN_WIDTHS[section]:
+                return QSize(_COLUMN_WIDTHS[section], 0)
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return section + 1
+        return None
+
+    def set_drafts(self, drafts: list):
+        """
+        Sync the model with a drafts list.
+
+        Only rows that were removed, added or whose text changed are
+        signalled; anything other than removals plus appends resets the
+        model.
+
+        Args:
+            drafts: List of DraftEmail objects
+        """
+        if not drafts:
+            self.clear()
+            return
+
+        new_ids = {draft.id for draft in drafts}
+        removed = [row for row, draft in enumerate(self._drafts) if draft.id not in new_ids]
+        current, added = drafts[:len(self._drafts) - len(removed)], drafts[len(self._drafts) - len(removed):]
+        expected = [draft.id for draft in self._drafts if draft.id in new_ids]
+        if len(new_ids) != len(drafts) or [draft.id for draft in current] != expected \
+                or any(draft.id in self._row_index for draft in added):
+            self.beginResetModel()
+            self._drafts = list(drafts)
+            self._columns = _format_columns(drafts[:self.FETCH_BATCH])
+            self._row_index = {draft.id: row for row, draft in enumerate(drafts)}
+            self.endResetModel()
+            return
+
+        # Remove bottom-up so the remaining row numbers stay valid
+        for row in reversed(removed):
+            if row < len(self._columns[0]):
+                self.beginRemoveRows(QModelIndex(), row, row)
+                for column in self._columns:
+                    del column[row]
+                del self._drafts[row]
+                self.endRemoveRows()
+            else:
+                del self._drafts[row]
+
+        # Compare whole columns first; only scan the ones that differ
+        self._drafts[:] = current
+        columns = _format_columns(current[:len(self._columns[0])])
+        first = last = None
+        for old, new in zip(self._columns, columns):
+            if old == new:
+                continue
+            changed = [row for row, (a, b) in enumerate(zip(old, new)) if a != b]
+            first = changed[0] if first is None else min(first, changed[0])
+            last = changed[-1] if last is None else max(last, changed[-1])
+        self._columns = columns
+        if first is not None:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, len(_HEADERS) - 1))
+
+        if removed:
+            self._row_index = {draft.id: row for row, draft in enumerate(self._drafts)}
+        self.append_drafts(added)
+
+    def append_drafts(self, drafts: list):
+        """
+        Append drafts as new rows.
+
+        When everything before them is exposed, up to FETCH_BATCH of the
+        new rows are inserted right away; the rest wait for fetchMore.
+
+        Args:
+            drafts: List of DraftEmail objects
+        """
+        if not drafts:
+            return
+
+        fully_exposed = not self.canFetchMore()
+        first = len(self._drafts)
+        self._drafts.extend(drafts)
+        for row, draft in enumerate(drafts, first):
+            self._row_index[draft.id] = row
+        if fully_exposed:
+            self._expose(first + self.FETCH_BATCH)
+
+    def update_status(self, draft_id: int, status: EmailStatus):
+        """
+        Update the status cell of a draft's row.
+
+        Args:
+            draft_id: Draft ID
+            status: New status
+        """
+        row = self._row_index.get(draft_id)
+        if row is None or row >= len(self._columns[0]):
+            return  # Not fetched yet; formatted from the draft on fetch
+
+        self._columns[_STATUS_COLUMN][row] = _status_text(status)
+        index = self.index(row, _STATUS_COLUMN)
+        self.dataChanged.emit(index, index)
+
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self._drafts = []
+        self._columns = [[] for _ in _HEADERS]
+        self._row_index = {}
+        self.endResetModel()
+
+
 class ReviewCard(ElevatedCardWidget):
     """
     Review card with draft table.
@@ -39,6 +271,9 @@ class ReviewCard(ElevatedCardWidget):
     preview_clicked = Signal()  # For empty state action
     cancel_generation = Signal()  # For progress card cancel
 
+    ROW_HEIGHT = 38  # Fluent table default, fixed so rows are never measured
+    REFRESH_MS = 30  # Coalesce drafts_changed bursts into one table update
+
     def __init__(self, state_store: StateStore, parent: QWidget = None):
         """
         Initialize review card.
@@ -49,6 +284,15 @@ class ReviewCard(ElevatedCardWidget):
         """
         super().__init__(parent)
         self.state_store = state_store
+        self._ready_count = 0  # Ready drafts shown in the table
+        self._streaming = False  # drafts_changed disconnected while streaming
+
+        # Debounced drafts_changed handling (see _on_drafts_changed)
+        self._pending_drafts = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_MS)
+        self._refresh_timer.timeout.connect(self._flush_drafts_changed)
 
         # Create UI
         layout = QVBoxLayout(self)
@@ -133,34 +377,31 @@ class ReviewCard(ElevatedCardWidget):
         layout.addWidget(self.empty_state)
 
         # Table
-        self.table = TableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Type", "Priority", "Category", "Subject", "Status", "Recipient"
-        ])
+        self.model = DraftTableModel(self)
+        self.table = TableView()
+        self.table.setModel(self.model)
+        self.table.setTextElideMode(Qt.TextElideMode.ElideRight)
 
-        # Set column widths - optimized for smaller screens
+        # Set column widths; Fixed/Stretch never scan cell text for a size
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(0, 40)   # ID - compact
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(1, 70)   # Type - reduced
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(2, 70)   # Priority - reduced
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(3, 100)  # Category - reduced
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)  # Subject - gets remaining space
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(5, 60)   # Status - reduced
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
-        header.resizeSection(6, 150)  # Recipient - reduced
+        for column, width in enumerate(_COLUMN_WIDTHS):
+            if width is None:
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
+            else:
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+                header.resizeSection(column, width)
+
+        # Uniform row height
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.ROW_HEIGHT)
 
         # Enable selection
-        self.table.setSelectionBehavior(TableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(TableWidget.SelectionMode.MultiSelection)
+        self.table.setSelectionBehavior(TableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(TableView.SelectionMode.MultiSelection)
 
         # Connect row click
-        self.table.cellClicked.connect(self._on_row_clicked)
+        self.table.clicked.connect(self._on_row_clicked)
 
         layout.addWidget(self.table)
 
@@ -177,9 +418,12 @@ class ReviewCard(ElevatedCardWidget):
     def _init_connections(self):
         """Initialize signal connections."""
         self.state_store.drafts_changed.connect(self._on_drafts_changed)
+        self.state_store.draft_status_changed.connect(self._on_draft_status_changed)
 
     def _load_from_state(self):
         """Load drafts from state."""
+        self._refresh_timer.stop()
+        self._pending_drafts = None
         self._populate_table(self.state_store.state.drafts)
 
     def _populate_table(self, drafts: list):
@@ -189,51 +433,15 @@ class ReviewCard(ElevatedCardWidget):
         Args:
             drafts: List of DraftEmail objects
         """
-        self.table.setRowCount(0)  # Clear existing
-
-        for draft in drafts:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # ID
-            id_item = QTableWidgetItem(str(draft.id))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, id_item)
-
-            # Type
-            type_item = QTableWidgetItem(draft.type.value)
-            self.table.setItem(row, 1, type_item)
-
-            # Priority
-            priority_item = QTableWidgetItem(draft.priority)
-            self.table.setItem(row, 2, priority_item)
-
-            # Category
-            category_text = draft.category
-            if draft.subcategory:
-                category_text += f" > {draft.subcategory}"
-            if draft.item:
-                category_text += f" > {draft.item}"
-            category_item = QTableWidgetItem(category_text)
-            self.table.setItem(row, 3, category_item)
-
-            # Subject (truncated)
-            subject = draft.subject
-            if len(subject) > 70:
-                subject = subject[:67] + "..."
-            subject_item = QTableWidgetItem(subject)
-            self.table.setItem(row, 4, subject_item)
-
-            # Status
-            status_item = QTableWidgetItem(self._get_status_icon(draft.status) + " " + draft.status.value.title())
-            self.table.setItem(row, 5, status_item)
-
-            # Recipient
-            recipient_item = QTableWidgetItem(str(draft.recipient))
-            self.table.setItem(row, 6, recipient_item)
+        self.model.set_drafts(drafts)
 
         # Update status label and toggle empty state
-        count = len(drafts)
+        self._ready_count = sum(1 for d in drafts if d.status == EmailStatus.READY)
+        self._update_status_label()
+
+    def _update_status_label(self):
+        """Update draft count label and toggle the empty state."""
+        count = self.model.draft_count()
         has_drafts = count > 0
 
         # Show/hide empty state vs table
@@ -243,32 +451,51 @@ class ReviewCard(ElevatedCardWidget):
         if count == 0:
             self.status_label.setText("No drafts")
         else:
-            ready_count = sum(1 for d in drafts if d.status == EmailStatus.READY)
-            self.status_label.setText(f"{count} drafts ({ready_count} ready)")
-
-    def _get_status_icon(self, status: EmailStatus) -> str:
-        """Get icon for status."""
-        if status == EmailStatus.DRAFT:
-            return "📝"
-        elif status == EmailStatus.READY:
-            return "✅"
-        elif status == EmailStatus.SENT:
-            return "✓"
-        elif status == EmailStatus.ERROR:
-            return "✖"
-        return "•"
-
-    def _on_row_clicked(self, row: int, column: int):
+            self.status_label.setText(f"{count} drafts ({self._ready_count} ready)")
+
+    def _on_row_clicked(self, index: QModelIndex):
         """Handle row click."""
-        # Get draft ID from first column
-        id_item = self.table.item(row, 0)
-        if id_item:
-            draft_id = int(id_item.text())
-            self.row_clicked.emit(draft_id)
+        self.row_clicked.emit(index.data(Qt.ItemDataRole.UserRole))
 
     def _on_drafts_changed(self, drafts: list):
-        """Handle drafts list change."""
-        self._populate_table(drafts)
+        """Handle drafts list change (applied after REFRESH_MS)."""
+        self._pending_drafts = drafts
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _flush_drafts_changed(self):
+        """Apply the latest pending drafts list."""
+        self._refresh_timer.stop()
+        drafts, self._pending_drafts = self._pending_drafts, None
+        if drafts is not None:
+            self._populate_table(drafts)
+
+    def _on_draft_status_changed(self, draft: DraftEmail, old_status: EmailStatus, new_status: EmailStatus):
+        """Handle a single draft status change."""
+        self.update_row_status(draft.id, new_status)
+
+        self._ready_count += (new_status == EmailStatus.READY) - (old_status == EmailStatus.READY)
+        self._update_status_label()
+
+    def begin_streaming(self):
+        """
+        Stop reacting to drafts_changed while rows are streamed in.
+
+        Rows arrive through add_draft_rows; call end_streaming when done.
+        """
+        if self._streaming:
+            return
+        self._streaming = True
+        self.state_store.drafts_changed.disconnect(self._on_drafts_changed)
+        self._flush_drafts_changed()
+
+    def end_streaming(self):
+        """Reconnect drafts_changed and reconcile the table with state."""
+        if not self._streaming:
+            return
+        self._streaming = False
+        self.state_store.drafts_changed.connect(self._on_drafts_changed)
+        self._load_from_state()
 
     def add_draft_row(self, draft: DraftEmail):
         """
@@ -277,32 +504,23 @@ class ReviewCard(ElevatedCardWidget):
         Args:
             draft: DraftEmail object
         """
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+        self.add_draft_rows([draft])
 
-        # Populate columns
-        self.table.setItem(row, 0, QTableWidgetItem(str(draft.id)))
-        self.table.setItem(row, 1, QTableWidgetItem(draft.type.value))
-        self.table.setItem(row, 2, QTableWidgetItem(draft.priority))
-
-        category_text = draft.category
-        if draft.subcategory:
-            category_text += f" > {draft.subcategory}"
-        if draft.item:
-            category_text += f" > {draft.item}"
-        self.table.setItem(row, 3, QTableWidgetItem(category_text))
+    def add_draft_rows(self, drafts: list):
+        """
+        Append several draft rows with a single model insert.
 
-        subject = draft.subject
-        if len(subject) > 70:
-            subject = subject[:67] + "..."
-        self.table.setItem(row, 4, QTableWidgetItem(subject))
+        Args:
+            drafts: List of DraftEmail objects
+        """
+        if not drafts:
+            return
 
-        self.table.setItem(row, 5, QTableWidgetItem(self._get_status_icon(draft.status) + " " + draft.status.value.title()))
-        self.table.setItem(row, 6, QTableWidgetItem(str(draft.recipient)))
+        self.model.append_drafts(drafts)
+        self._ready_count += sum(1 for d in drafts if d.status == EmailStatus.READY)
 
         # Update status
-        count = self.table.rowCount()
-        self.status_label.setText(f"{count} drafts")
+        self._update_status_label()
 
     def update_row_status(self, draft_id: int, status: EmailStatus):
         """
@@ -312,13 +530,7 @@ class ReviewCard(ElevatedCardWidget):
             draft_id: Draft ID
             status: New status
         """
-        for row in range(self.table.rowCount()):
-            id_item = self.table.item(row, 0)
-            if id_item and int(id_item.text()) == draft_id:
-                status_item = self.table.item(row, 5)
-                if status_item:
-                    status_item.setText(self._get_status_icon(status) + " " + status.value.title())
-                break
+        self.model.update_status(draft_id, status)
 
     def get_selected_draft_ids(self) -> list:
         """
@@ -327,18 +539,13 @@ class ReviewCard(ElevatedCardWidget):
         Returns:
             List of draft IDs
         """
-        selected_rows = set(item.row() for item in self.table.selectedItems())
-        draft_ids = []
-
-        for row in selected_rows:
-            id_item = self.table.item(row, 0)
-            if id_item:
-                draft_ids.append(int(id_item.text()))
-
-        return draft_ids
+        # One index per fully selected row (rows are selected whole)
+        rows = self.table.selectionModel().selectedRows(0)
+        return [index.data(Qt.ItemDataRole.UserRole) for index in rows]
 
     def select_all_rows(self):
         """Select all rows."""
+        self.model.fetch_all()
         self.table.selectAll()
 
     def clear_selection(self):
@@ -347,8 +554,9 @@ class ReviewCard(ElevatedCardWidget):
 
     def clear_table(self):
         """Clear all rows."""
-        self.table.setRowCount(0)
-        self.status_label.setText("No drafts")
+        self.model.clear()
+        self._ready_count = 0
+        self._update_status_label()
 
     def _on_cancel_clicked(self):
         """Handle cancel button click from progress card."""
@@ -390,6 +598,6 @@ class ReviewCard(ElevatedCardWidget):
         self.progress_card.hide_progress()
 
         # Show table or empty state based on drafts
-        has_drafts = self.table.rowCount() > 0
+        has_drafts = self.model.draft_count() > 0
         self.table.setVisible(has_drafts)
         self.empty_state.setVisible(not has_drafts)
@@ -2,7 +2,9 @@
 Review detail sheet - slide-in drawer for email preview.
 """
 
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtCore import (
+    Qt, Signal, QPropertyAnimation, QAbstractAnimation, QEasingCurve, QRect, QTimer
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QScrollArea, QLabel
@@ -29,6 +31,9 @@ class ReviewDetailSheet(QWidget):
     closed = Signal()
     mark_ready_clicked = Signal(int)
 
+    # Detected field rows, in display order
+    FIELD_NAMES = ("ID", "Type", "Priority", "Category", "Sub-Category", "Item", "Recipient", "Error")
+
     def __init__(self, state_store: StateStore, parent: QWidget = None):
         """
         Initialize review detail sheet.
@@ -40,6 +45,8 @@ class ReviewDetailSheet(QWidget):
         super().__init__(parent)
         self.state_store = state_store
         self.current_draft_id = None
+        self._shown_body = None  # Body text currently in body_text
+        self._copy_text = None  # Clipboard text for the current draft, built on first copy
 
         # Set up widget
         self.setFixedWidth(480)
@@ -99,8 +106,8 @@ class ReviewDetailSheet(QWidget):
         scroll_layout.addWidget(subject_card)
 
         # Detected fields card
-        fields_card = SimpleCardWidget()
-        fields_card_layout = QVBoxLayout(fields_card)
+        self.fields_card = SimpleCardWidget()
+        fields_card_layout = QVBoxLayout(self.fields_card)
         fields_card_layout.setSpacing(12)
 
         fields_card_layout.addWidget(SubtitleLabel("Detected Fields"))
@@ -109,11 +116,22 @@ class ReviewDetailSheet(QWidget):
         self.fields_grid.setSpacing(8)
         self.fields_grid.setColumnStretch(1, 1)
 
-        # Create field labels (will be populated dynamically)
+        # Create field rows once; _populate_fields sets text and visibility
         self.field_labels = {}
+        self._field_rows = {}
+        for row, name in enumerate(self.FIELD_NAMES):
+            label = CaptionLabel(name + ":")
+            label.setStyleSheet("color: gray;")
+            self.fields_grid.addWidget(label, row, 0, Qt.AlignmentFlag.AlignRight)
+
+            value = BodyLabel("")
+            value.setWordWrap(True)
+            self.fields_grid.addWidget(value, row, 1)
+
+            self._field_rows[name] = (label, value)
 
         fields_card_layout.addLayout(self.fields_grid)
-        scroll_layout.addWidget(fields_card)
+        scroll_layout.addWidget(self.fields_card)
 
         # Body card
         body_card = SimpleCardWidget()
@@ -157,6 +175,16 @@ class ReviewDetailSheet(QWidget):
 
         layout.addWidget(footer)
 
+        # Slide animations, created once and re-targeted on each show/close
+        self._open_animation = QPropertyAnimation(self, b"geometry", self)
+        self._open_animation.setDuration(300)
+        self._open_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+
+        self._close_animation = QPropertyAnimation(self, b"geometry", self)
+        self._close_animation.setDuration(250)
+        self._close_animation.setEasingCurve(QEasingCurve.Type.InCubic)
+        self._close_animation.finished.connect(lambda: self.setVisible(False))
+
         # Initially hidden
         self.setVisible(False)
 
@@ -171,32 +199,64 @@ class ReviewDetailSheet(QWidget):
         if not draft:
             return
 
+        # Same draft already open: only status and fields can have changed
+        if (draft_id == self.current_draft_id and self.isVisible()
+                and self._close_animation.state() != QAbstractAnimation.State.Running):
+            self._update_status_badge(draft.status)
+            self._populate_fields(draft)
+            return
+
         self.current_draft_id = draft_id
+        self._copy_text = None
 
         # Update UI
         self.subject_label.setText(draft.subject)
-        self.body_text.setPlainText(draft.body)
+        self._update_status_badge(draft.status)
+
+        # Show sheet with animation, then fill the heavier body and fields
+        self.show_sheet()
+        QTimer.singleShot(0, lambda: self._finish_populate(draft_id))
+
+    def _finish_populate(self, draft_id: int):
+        """
+        Fill body and fields once the slide-in has started.
+
+        Args:
+            draft_id: Draft ID requested by show_draft
+        """
+        # Skip if another draft was opened in the meantime
+        if draft_id != self.current_draft_id:
+            return
+
+        draft = self.state_store.state.get_draft_by_id(draft_id)
+        if not draft:
+            return
 
-        # Update fields
         self._populate_fields(draft)
+        if draft.body != self._shown_body:
+            self._shown_body = draft.body
+            self.body_text.setPlainText(draft.body)
 
-        # Update status badge
-        if draft.status == EmailStatus.DRAFT:
+    def _update_status_badge(self, status: EmailStatus):
+        """
+        Update the footer status badge.
+
+        Args:
+            status: Draft status
+        """
+        if status == EmailStatus.DRAFT:
             self.status_badge.setLevel(InfoLevel.ATTENTION)
             self.status_badge.setText("Draft")
-        elif draft.status == EmailStatus.READY:
+        elif status == EmailStatus.READY:
             self.status_badge.setLevel(InfoLevel.SUCCESS)
             self.status_badge.setText("Ready")
-        elif draft.status == EmailStatus.SENT:
+        elif status == EmailStatus.SENT:
             self.status_badge.setLevel(InfoLevel.SUCCESS)
             self.status_badge.setText("Sent")
-        elif draft.status == EmailStatus.ERROR:
+        elif status == EmailStatus.ERROR:
             self.status_badge.setLevel(InfoLevel.ERROR)
             self.status_badge.setText("Error")
 
-        # Show sheet with animation
-        self.show_sheet()
-
     def _populate_fields(self, draft: DraftEmail):
         """
         Populate detected fields grid.
@@ -204,96 +264,73 @@ class ReviewDetailSheet(QWidget):
         Args:
             draft: DraftEmail object
         """
-        # Clear existing
-        while self.fields_grid.count():
-            item = self.fields_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        self.field_labels.clear()
-
-        row = 0
-
-        # Add fields
-        fields = [
-            ("ID", str(draft.id)),
-            ("Type", draft.type.value),
-            ("Priority", draft.priority),
-            ("Category", draft.category),
-        ]
-
-        if draft.subcategory:
-            fields.append(("Sub-Category", draft.subcategory))
-
-        if draft.item:
-            fields.append(("Item", draft.item))
-
-        fields.append(("Recipient", str(draft.recipient)))
-
-        if draft.error_message:
-            fields.append(("Error", draft.error_message))
-
-        for label_text, value_text in fields:
-            label = CaptionLabel(label_text + ":")
-            label.setStyleSheet("color: gray;")
-            self.fields_grid.addWidget(label, row, 0, Qt.AlignmentFlag.AlignRight)
-
-            value = BodyLabel(value_text)
-            value.setWordWrap(True)
-            self.fields_grid.addWidget(value, row, 1)
+        # Optional fields are None when missing and their rows are hidden
+        values = {
+            "ID": str(draft.id),
+            "Type": draft.type.value,
+            "Priority": draft.priority,
+            "Category": draft.category,
+            "Sub-Category": draft.subcategory or None,
+            "Item": draft.item or None,
+            "Recipient": draft.recipient,
+            "Error": draft.error_message or None,
+        }
+
+        # Update the grid with a single repaint
+        self.fields_card.setUpdatesEnabled(False)
+        try:
+            self.field_labels.clear()
+            for name, (label, value) in self._field_rows.items():
+                text = values[name]
+                shown = text is not None
+                if shown:
+                    value.setText(text)
+                    self.field_labels[name] = value
+                # Only toggle rows whose visibility changes, so the grid is
+                # not re-laid out when the same fields are shown again
+                if value.isHidden() == shown:
+                    label.setVisible(shown)
+                    value.setVisible(shown)
+        finally:
+            self.fields_card.setUpdatesEnabled(True)
+
+    def _sheet_geometries(self) -> tuple:
+        """
+        Get the off-screen and open geometries for the parent's current size.
 
-            self.field_labels[label_text] = value
-            row += 1
+        Returns:
+            Tuple of (offscreen_rect, open_rect)
+        """
+        parent_rect = self.parent().rect()
+        right, height, width = parent_rect.right(), parent_rect.height(), self.width()
+        return QRect(right, 0, width, height), QRect(right - width, 0, width, height)
 
     def show_sheet(self):
         """Show sheet with slide-in animation."""
-        if not self.isVisible():
-            self.setVisible(True)
-
-            # Animate from right
-            self.animation = QPropertyAnimation(self, b"geometry")
-            parent_rect = self.parent().rect()
-
-            start_rect = QRect(
-                parent_rect.right(),
-                0,
-                self.width(),
-                parent_rect.height()
-            )
-            end_rect = QRect(
-                parent_rect.right() - self.width(),
-                0,
-                self.width(),
-                parent_rect.height()
-            )
+        closing = self._close_animation.state() == QAbstractAnimation.State.Running
+        if self.isVisible() and not closing:
+            return
+
+        # Reverse a close that is still running from where it got to
+        self._close_animation.stop()
+        offscreen_rect, open_rect = self._sheet_geometries()
+        self._open_animation.setStartValue(self.geometry() if closing else offscreen_rect)
+        self._open_animation.setEndValue(open_rect)
+        self.setVisible(True)
 
-            self.animation.setDuration(300)
-            self.animation.setStartValue(start_rect)
-            self.animation.setEndValue(end_rect)
-            self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self.animation.start()
+        # Animate from right
+        self._open_animation.start()
 
     def close_sheet(self):
         """Close sheet with slide-out animation."""
-        if self.isVisible():
-            # Animate to right
-            self.animation = QPropertyAnimation(self, b"geometry")
-            parent_rect = self.parent().rect()
-
-            start_rect = self.geometry()
-            end_rect = QRect(
-                parent_rect.right(),
-                0,
-                self.width(),
-                parent_rect.height()
-            )
+        if self.isVisible() and self._close_animation.state() != QAbstractAnimation.State.Running:
+            self._open_animation.stop()
 
-            self.animation.setDuration(250)
-            self.animation.setStartValue(start_rect)
-            self.animation.setEndValue(end_rect)
-            self.animation.setEasingCurve(QEasingCurve.Type.InCubic)
-            self.animation.finished.connect(lambda: self.setVisible(False))
-            self.animation.start()
+            # Animate to right
+            offscreen_rect, _ = self._sheet_geometries()
+            self._close_animation.setStartValue(self.geometry())
+            self._close_animation.setEndValue(offscreen_rect)
+            self._close_animation.start()
 
             self.closed.emit()
 
@@ -311,16 +348,19 @@ class ReviewDetailSheet(QWidget):
         if self.current_draft_id is not None:
             from PySide6.QtWidgets import QApplication
 
-            draft = self.state_store.state.get_draft_by_id(self.current_draft_id)
-            if draft:
-                text = f"Subject: {draft.subject}\n\n{draft.body}"
-                QApplication.clipboard().setText(text)
-
-                from qfluentwidgets import InfoBar, InfoBarPosition
-                InfoBar.success(
-                    title="Copied",
-                    content="Email content copied to clipboard.",
-                    parent=self,
-                    duration=2000,
-                    position=InfoBarPosition.TOP
-                )
+            if self._copy_text is None:
+                draft = self.state_store.state.get_draft_by_id(self.current_draft_id)
+                if not draft:
+                    return
+                self._copy_text = f"Subject: {draft.subject}\n\n{draft.body}"
+
+            QApplication.clipboard().setText(self._copy_text)
+
+            from qfluentwidgets import InfoBar, InfoBarPosition
+            InfoBar.success(
+                title="Copied",
+                content="Email content copied to clipboard.",
+                parent=self,
+                duration=2000,
+                position=InfoBarPosition.TOP
+            )
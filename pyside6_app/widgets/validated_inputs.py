@@ -2,15 +2,92 @@
 Validated input widgets with inline validation feedback.
 """
 
-from typing import Callable, Tuple, Optional
-from PySide6.QtCore import Signal, QTimer
+import functools
+import inspect
+import math
+import time
+from typing import Callable, Tuple, Optional, Literal
+from PySide6.QtCore import Signal, QTimer, Slot
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
 from qfluentwidgets import (
     LineEdit, PasswordLineEdit, CaptionLabel, TransparentToolButton,
-    FluentIcon, isDarkTheme
+    FluentIcon, isDarkTheme, qconfig, setCustomStyleSheet
 )
 
 
+# Status icon glyphs
+_CHECK = "\u2713"
+_CROSS = "\u2717"
+
+# Validation colors per theme
+_COLORS = {
+    'dark': {'valid': "#58d68d", 'invalid': "#ec7063"},
+    'light': {'valid': "#27ae60", 'invalid': "#e74c3c"},
+}
+
+# Error label stylesheet per theme
+_ERROR_STYLES = {
+    theme: f"color: {colors['invalid']}; font-size: 11px;"
+    for theme, colors in _COLORS.items()
+}
+
+
+# Status icon stylesheet per (theme, state)
+_ICON_STYLES = {
+    (theme, state): f"color: {color};" if color else ""
+    for theme, colors in _COLORS.items()
+    for state, color in {**colors, 'neutral': None}.items()
+}
+
+
+def _build_input_qss(selector: str) -> Tuple[str, str]:
+    """
+    Build the static light and dark border QSS for an input widget.
+
+    The rules match on the widget's "validation" property, so changing
+    state only needs a re-polish instead of a new style sheet.
+
+    Args:
+        selector: Stylesheet type selector for the input widget
+
+    Returns:
+        Tuple of (light_qss, dark_qss)
+    """
+    return tuple(
+        "\n".join(
+            f'{selector}[validation="{state}"] {{ border: 1px solid {color}; }}'
+            for state, color in _COLORS[theme].items()
+        )
+        for theme in ('light', 'dark')
+    )
+
+
+def _memoize_validator(validator: Callable[[str], Tuple[bool, str]]) -> Callable[[str], Tuple[bool, str]]:
+    """
+    Wrap a stateless validator in an LRU cache.
+
+    Only plain functions without closures and classmethods (e.g.
+    EmailValidator.validate) are cached; anything else may depend on
+    mutable state and is returned unchanged.
+
+    Args:
+        validator: Function that takes text and returns (is_valid, error_message)
+
+    Returns:
+        The cached or original validator
+    """
+    if inspect.isfunction(validator):
+        stateless = validator.__closure__ is None
+    else:
+        stateless = inspect.ismethod(validator) and isinstance(validator.__self__, type)
+    return functools.lru_cache(maxsize=64)(validator) if stateless else validator
+
+
+def _theme_key() -> str:
+    """Get the current theme as a _COLORS key."""
+    return 'dark' if isDarkTheme() else 'light'
+
+
 class ValidatedLineEdit(QWidget):
     """
     LineEdit with inline validation feedback.
@@ -20,18 +97,29 @@ class ValidatedLineEdit(QWidget):
     - Valid: Green border + checkmark
     - Invalid: Red border + error message below
 
-    Validation is debounced by 300ms to avoid rapid updates.
+    Validation is debounced by DEBOUNCE_MS to avoid rapid updates, on a
+    single timer shared by all instances. Expensive validators can use
+    validate_mode "lost_focus" (validate on editing finished) or "manual"
+    (only force_validate) instead.
     """
 
-    textChanged = Signal(str)
+    textChanged = Signal(str)  # Every edit; prefer textChangedDebounced for heavy slots
+    textChangedDebounced = Signal(str)  # Text at each validation, once per distinct value
     validationChanged = Signal(bool, str)  # is_valid, error_message
 
+    DEBOUNCE_MS = 400  # Quiet period after the last keystroke before validating
+    VALIDATE_MODES = ("input", "lost_focus", "manual")
+    _shared_timer = None  # Debounce timer shared by all instances, created on first use
+    _pending_instance = None  # Instance the shared timer will validate
+    _INPUT_QSS = _build_input_qss("LineEdit")
+
     def __init__(
         self,
         validator: Callable[[str], Tuple[bool, str]],
         placeholder: str = "",
         tooltip: str = "",
-        parent: QWidget = None
+        parent: QWidget = None,
+        validate_mode: Literal["input", "lost_focus", "manual"] = "input"
     ):
         """
         Initialize validated line edit.
@@ -41,16 +129,29 @@ class ValidatedLineEdit(QWidget):
             placeholder: Placeholder text
             tooltip: Tooltip text
             parent: Parent widget
+            validate_mode: When to validate - "input" (debounced while typing),
+                "lost_focus" (on editing finished) or "manual" (force_validate only)
         """
         super().__init__(parent)
-        self._validator = validator
+        if validate_mode not in self.VALIDATE_MODES:
+            raise ValueError(f"Invalid validate_mode: {validate_mode}")
+        self._validate_mode = validate_mode
+        self._validator = _memoize_validator(validator)
         self._is_valid = True
         self._has_been_edited = False
-        self._debounce_timer = QTimer()
-        self._debounce_timer.setSingleShot(True)
-        self._debounce_timer.timeout.connect(self._do_validate)
+        self._last_validated_text = None  # Text the cached result belongs to
+        self._last_debounced_text = None  # Last text sent via textChangedDebounced
+        self._last_result = (True, "")
+        self._last_emitted = None  # Last (is_valid, error) sent via validationChanged
+        self._deadline = 0.0  # Monotonic time the debounce period ends
+        self._theme_key = _theme_key()
+        self._state = "neutral"
+        self._current_style = ""  # Status icon stylesheet currently applied
+        self._last_error_theme = None  # Theme the error label was last styled for
+        self._applied_state = None  # Last (state, error) shown by _set_state
 
         self._setup_ui(placeholder, tooltip)
+        qconfig.themeChangedFinished.connect(self._on_theme_changed)
 
     def _setup_ui(self, placeholder: str, tooltip: str):
         """Set up the UI components."""
@@ -64,6 +165,8 @@ class ValidatedLineEdit(QWidget):
 
         self._input = LineEdit()
         self._input.setPlaceholderText(placeholder)
+        # Fluent keeps custom QSS across theme changes
+        setCustomStyleSheet(self._input, *self._INPUT_QSS)
         if tooltip:
             self._input.setToolTip(tooltip)
         self._input.textChanged.connect(self._on_text_changed)
@@ -80,15 +183,31 @@ class ValidatedLineEdit(QWidget):
         self._error_label = CaptionLabel("")
         self._error_label.setWordWrap(True)
         self._error_label.setVisible(False)
-        self._update_error_style()
         layout.addWidget(self._error_label)
 
     def _update_error_style(self):
-        """Update error label style based on theme."""
-        if isDarkTheme():
-            self._error_label.setStyleSheet("color: #ec7063; font-size: 11px;")
-        else:
-            self._error_label.setStyleSheet("color: #e74c3c; font-size: 11px;")
+        """Update error label style based on theme, if not already styled for it."""
+        if self._last_error_theme != self._theme_key:
+            self._error_label.setStyleSheet(_ERROR_STYLES[self._theme_key])
+            self._last_error_theme = self._theme_key
+
+    @Slot()
+    def _on_theme_changed(self):
+        """Re-apply the cached label styles for the new theme."""
+        self._theme_key = _theme_key()
+        # Fluent has just re-applied the labels' own style sheets
+        self._last_error_theme = None
+        self._current_style = ""
+        if self._state == "invalid":
+            self._update_error_style()  # Otherwise styled when next shown
+        self._apply_icon_style()
+
+    def _apply_icon_style(self):
+        """Apply the status icon stylesheet unless it is already applied."""
+        icon_style = _ICON_STYLES[(self._theme_key, self._state)]
+        if icon_style != self._current_style:
+            self._status_icon.setStyleSheet(icon_style)
+            self._current_style = icon_style
 
     def text(self) -> str:
         """Get current text."""
@@ -119,20 +238,66 @@ class ValidatedLineEdit(QWidget):
         """Set focus to the input."""
         self._input.setFocus()
 
+    @Slot(str)
     def _on_text_changed(self, text: str):
         """Handle text change."""
         self.textChanged.emit(text)
-        # Debounce validation to avoid rapid updates
-        self._debounce_timer.start(300)
+        if self._validate_mode != "input":
+            # Validated later; drop feedback that no longer matches the text
+            self._set_state("neutral")
+            return
+
+        # Debounce validation: push the deadline back, the shared timer is
+        # only (re)started when it isn't already running
+        self._deadline = time.monotonic() + self.DEBOUNCE_MS / 1000
+        pending = ValidatedLineEdit._pending_instance
+        if pending is not self:
+            ValidatedLineEdit._pending_instance = self
+            if pending is not None:
+                # Another input was still waiting, validate it now
+                try:
+                    pending._do_validate()
+                except RuntimeError:
+                    pass  # Widget was deleted while waiting
+
+        timer = ValidatedLineEdit._shared_timer
+        if timer is None:
+            timer = ValidatedLineEdit._shared_timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(ValidatedLineEdit._on_shared_timeout)
+        if not timer.isActive():
+            timer.start(self.DEBOUNCE_MS)
+
+    @staticmethod
+    def _on_shared_timeout():
+        """Validate the pending input once its deadline has passed, otherwise wait out the rest."""
+        instance = ValidatedLineEdit._pending_instance
+        if instance is None:
+            return
+        remaining = instance._deadline - time.monotonic()
+        if remaining > 0:
+            ValidatedLineEdit._shared_timer.start(math.ceil(remaining * 1000))
+            return
+        ValidatedLineEdit._pending_instance = None
+        try:
+            instance._do_validate()
+        except RuntimeError:
+            pass  # Widget was deleted while waiting
 
+    @Slot()
     def _on_editing_finished(self):
         """Handle editing finished (focus lost or Enter pressed)."""
+        if self._validate_mode == "manual":
+            return
         self._has_been_edited = True
         self._do_validate()
 
     def _do_validate(self):
         """Perform validation."""
         text = self._input.text()
+        if text != self._last_debounced_text:
+            self._last_debounced_text = text
+            self.textChangedDebounced.emit(text)
 
         if not text:
             # Empty - neutral state
@@ -140,7 +305,11 @@ class ValidatedLineEdit(QWidget):
             self._is_valid = True
             return
 
-        is_valid, error = self._validator(text)
+        # Reuse the previous result when the text hasn't changed
+        if text != self._last_validated_text:
+            self._last_result = self._validator(text)
+            self._last_validated_text = text
+        is_valid, error = self._last_result
         self._is_valid = is_valid
 
         if is_valid:
@@ -148,7 +317,9 @@ class ValidatedLineEdit(QWidget):
         elif self._has_been_edited:
             self._set_state("invalid", error)
 
-        self.validationChanged.emit(is_valid, error)
+        if self._last_result != self._last_emitted:
+            self._last_emitted = self._last_result
+            self.validationChanged.emit(is_valid, error)
 
     def _set_state(self, state: str, error: str = ""):
         """
@@ -158,30 +329,32 @@ class ValidatedLineEdit(QWidget):
             state: One of "valid", "invalid", or "neutral"
             error: Error message to display (for invalid state)
         """
-        if isDarkTheme():
-            valid_color = "#58d68d"
-            invalid_color = "#ec7063"
-        else:
-            valid_color = "#27ae60"
-            invalid_color = "#e74c3c"
+        if (state, error) == self._applied_state:
+            return
+
+        self._state = state
+        # The border comes from the static validation QSS; re-polish so
+        # the property selectors are matched again
+        self._input.setProperty("validation", state)
+        style = self._input.style()
+        style.unpolish(self._input)
+        style.polish(self._input)
+        self._apply_icon_style()
 
         if state == "valid":
-            self._input.setStyleSheet(f"LineEdit {{ border: 1px solid {valid_color}; }}")
-            self._status_icon.setText("\u2713")  # Checkmark
-            self._status_icon.setStyleSheet(f"color: {valid_color};")
+            self._status_icon.setText(_CHECK)
             self._error_label.setVisible(False)
         elif state == "invalid":
-            self._input.setStyleSheet(f"LineEdit {{ border: 1px solid {invalid_color}; }}")
-            self._status_icon.setText("\u2717")  # X mark
-            self._status_icon.setStyleSheet(f"color: {invalid_color};")
+            self._status_icon.setText(_CROSS)
             self._error_label.setText(error)
             self._update_error_style()
             self._error_label.setVisible(True)
         else:  # neutral
-            self._input.setStyleSheet("")
             self._status_icon.setText("")
             self._error_label.setVisible(False)
 
+        self._applied_state = (state, error)
+
     def is_valid(self) -> bool:
         """Check if current input is valid."""
         return self._is_valid
@@ -201,15 +374,23 @@ class ValidatedPasswordEdit(QWidget):
     and a toggle button to show/hide the password.
     """
 
-    textChanged = Signal(str)
+    textChanged = Signal(str)  # Every edit; prefer textChangedDebounced for heavy slots
+    textChangedDebounced = Signal(str)  # Text at each validation, once per distinct value
     validationChanged = Signal(bool, str)  # is_valid, error_message
 
+    DEBOUNCE_MS = 400  # Quiet period after the last keystroke before validating
+    VALIDATE_MODES = ("input", "lost_focus", "manual")
+    _shared_timer = None  # Debounce timer shared by all instances, created on first use
+    _pending_instance = None  # Instance the shared timer will validate
+    _INPUT_QSS = _build_input_qss("PasswordLineEdit")
+
     def __init__(
         self,
         validator: Callable[[str], Tuple[bool, str]],
         placeholder: str = "",
         tooltip: str = "",
-        parent: QWidget = None
+        parent: QWidget = None,
+        validate_mode: Literal["input", "lost_focus", "manual"] = "input"
     ):
         """
         Initialize validated password edit.
@@ -219,16 +400,29 @@ class ValidatedPasswordEdit(QWidget):
             placeholder: Placeholder text
             tooltip: Tooltip text
             parent: Parent widget
+            validate_mode: When to validate - "input" (debounced while typing),
+                "lost_focus" (on editing finished) or "manual" (force_validate only)
         """
         super().__init__(parent)
-        self._validator = validator
+        if validate_mode not in self.VALIDATE_MODES:
+            raise ValueError(f"Invalid validate_mode: {validate_mode}")
+        self._validate_mode = validate_mode
+        self._validator = _memoize_validator(validator)
         self._is_valid = True
         self._has_been_edited = False
-        self._debounce_timer = QTimer()
-        self._debounce_timer.setSingleShot(True)
-        self._debounce_timer.timeout.connect(self._do_validate)
+        self._last_validated_text = None  # Text the cached result belongs to
+        self._last_debounced_text = None  # Last text sent via textChangedDebounced
+        self._last_result = (True, "")
+        self._last_emitted = None  # Last (is_valid, error) sent via validationChanged
+        self._deadline = 0.0  # Monotonic time the debounce period ends
+        self._theme_key = _theme_key()
+        self._state = "neutral"
+        self._current_style = ""  # Status icon stylesheet currently applied
+        self._last_error_theme = None  # Theme the error label was last styled for
+        self._applied_state = None  # Last (state, error) shown by _set_state
 
         self._setup_ui(placeholder, tooltip)
+        qconfig.themeChangedFinished.connect(self._on_theme_changed)
 
     def _setup_ui(self, placeholder: str, tooltip: str):
         """Set up the UI components."""
@@ -242,6 +436,8 @@ class ValidatedPasswordEdit(QWidget):
 
         self._input = PasswordLineEdit()
         self._input.setPlaceholderText(placeholder)
+        # Fluent keeps custom QSS across theme changes
+        setCustomStyleSheet(self._input, *self._INPUT_QSS)
         if tooltip:
             self._input.setToolTip(tooltip)
         self._input.textChanged.connect(self._on_text_changed)
@@ -265,16 +461,33 @@ class ValidatedPasswordEdit(QWidget):
         self._error_label = CaptionLabel("")
         self._error_label.setWordWrap(True)
         self._error_label.setVisible(False)
-        self._update_error_style()
         layout.addWidget(self._error_label)
 
     def _update_error_style(self):
-        """Update error label style based on theme."""
-        if isDarkTheme():
-            self._error_label.setStyleSheet("color: #ec7063; font-size: 11px;")
-        else:
-            self._error_label.setStyleSheet("color: #e74c3c; font-size: 11px;")
-
+        """Update error label style based on theme, if not already styled for it."""
+        if self._last_error_theme != self._theme_key:
+            self._error_label.setStyleSheet(_ERROR_STYLES[self._theme_key])
+            self._last_error_theme = self._theme_key
+
+    @Slot()
+    def _on_theme_changed(self):
+        """Re-apply the cached label styles for the new theme."""
+        self._theme_key = _theme_key()
+        # Fluent has just re-applied the labels' own style sheets
+        self._last_error_theme = None
+        self._current_style = ""
+        if self._state == "invalid":
+            self._update_error_style()  # Otherwise styled when next shown
+        self._apply_icon_style()
+
+    def _apply_icon_style(self):
+        """Apply the status icon stylesheet unless it is already applied."""
+        icon_style = _ICON_STYLES[(self._theme_key, self._state)]
+        if icon_style != self._current_style:
+            self._status_icon.setStyleSheet(icon_style)
+            self._current_style = icon_style
+
+    @Slot()
     def _toggle_visibility(self):
         """Toggle password visibility."""
         if self._input.echoMode() == LineEdit.EchoMode.Password:
@@ -316,20 +529,66 @@ class ValidatedPasswordEdit(QWidget):
         """Set focus to the input."""
         self._input.setFocus()
 
+    @Slot(str)
     def _on_text_changed(self, text: str):
         """Handle text change."""
         self.textChanged.emit(text)
-        # Debounce validation to avoid rapid updates
-        self._debounce_timer.start(300)
+        if self._validate_mode != "input":
+            # Validated later; drop feedback that no longer matches the text
+            self._set_state("neutral")
+            return
+
+        # Debounce validation: push the deadline back, the shared timer is
+        # only (re)started when it isn't already running
+        self._deadline = time.monotonic() + self.DEBOUNCE_MS / 1000
+        pending = ValidatedPasswordEdit._pending_instance
+        if pending is not self:
+            ValidatedPasswordEdit._pending_instance = self
+            if pending is not None:
+                # Another input was still waiting, validate it now
+                try:
+                    pending._do_validate()
+                except RuntimeError:
+                    pass  # Widget was deleted while waiting
+
+        timer = ValidatedPasswordEdit._shared_timer
+        if timer is None:
+            timer = ValidatedPasswordEdit._shared_timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(ValidatedPasswordEdit._on_shared_timeout)
+        if not timer.isActive():
+            timer.start(self.DEBOUNCE_MS)
+
+    @staticmethod
+    def _on_shared_timeout():
+        """Validate the pending input once its deadline has passed, otherwise wait out the rest."""
+        instance = ValidatedPasswordEdit._pending_instance
+        if instance is None:
+            return
+        remaining = instance._deadline - time.monotonic()
+        if remaining > 0:
+            ValidatedPasswordEdit._shared_timer.start(math.ceil(remaining * 1000))
+            return
+        ValidatedPasswordEdit._pending_instance = None
+        try:
+            instance._do_validate()
+        except RuntimeError:
+            pass  # Widget was deleted while waiting
 
+    @Slot()
     def _on_editing_finished(self):
         """Handle editing finished (focus lost or Enter pressed)."""
+        if self._validate_mode == "manual":
+            return
         self._has_been_edited = True
         self._do_validate()
 
     def _do_validate(self):
         """Perform validation."""
         text = self._input.text()
+        if text != self._last_debounced_text:
+            self._last_debounced_text = text
+            self.textChangedDebounced.emit(text)
 
         if not text:
             # Empty - neutral state
@@ -337,7 +596,11 @@ class ValidatedPasswordEdit(QWidget):
             self._is_valid = True
             return
 
-        is_valid, error = self._validator(text)
+        # Reuse the previous result when the text hasn't changed
+        if text != self._last_validated_text:
+            self._last_result = self._validator(text)
+            self._last_validated_text = text
+        is_valid, error = self._last_result
         self._is_valid = is_valid
 
         if is_valid:
@@ -345,7 +608,9 @@ class ValidatedPasswordEdit(QWidget):
         elif self._has_been_edited:
             self._set_state("invalid", error)
 
-        self.validationChanged.emit(is_valid, error)
+        if self._last_result != self._last_emitted:
+            self._last_emitted = self._last_result
+            self.validationChanged.emit(is_valid, error)
 
     def _set_state(self, state: str, error: str = ""):
         """
@@ -355,30 +620,32 @@ class ValidatedPasswordEdit(QWidget):
             state: One of "valid", "invalid", or "neutral"
             error: Error message to display (for invalid state)
         """
-        if isDarkTheme():
-            valid_color = "#58d68d"
-            invalid_color = "#ec7063"
-        else:
-            valid_color = "#27ae60"
-            invalid_color = "#e74c3c"
+        if (state, error) == self._applied_state:
+            return
+
+        self._state = state
+        # The border comes from the static validation QSS; re-polish so
+        # the property selectors are matched again
+        self._input.setProperty("validation", state)
+        style = self._input.style()
+        style.unpolish(self._input)
+        style.polish(self._input)
+        self._apply_icon_style()
 
         if state == "valid":
-            self._input.setStyleSheet(f"PasswordLineEdit {{ border: 1px solid {valid_color}; }}")
-            self._status_icon.setText("\u2713")  # Checkmark
-            self._status_icon.setStyleSheet(f"color: {valid_color};")
+            self._status_icon.setText(_CHECK)
             self._error_label.setVisible(False)
         elif state == "invalid":
-            self._input.setStyleSheet(f"PasswordLineEdit {{ border: 1px solid {invalid_color}; }}")
-            self._status_icon.setText("\u2717")  # X mark
-            self._status_icon.setStyleSheet(f"color: {invalid_color};")
+            self._status_icon.setText(_CROSS)
             self._error_label.setText(error)
             self._update_error_style()
             self._error_label.setVisible(True)
         else:  # neutral
-            self._input.setStyleSheet("")
             self._status_icon.setText("")
             self._error_label.setVisible(False)
 
+        self._applied_state = (state, error)
+
     def is_valid(self) -> bool:
         """Check if current input is valid."""
         return self._is_valid
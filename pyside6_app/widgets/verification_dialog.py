@@ -3,12 +3,243 @@ Verification Results Dialog - Shows detailed ticket verification information.
 """
 
 from typing import Dict, List
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QDialog
+from PySide6.QtCore import (
+    Qt, QObject, Signal, Slot, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView, QDialog
 from qfluentwidgets import (
     SubtitleLabel, BodyLabel, PushButton, FluentIcon,
-    TableWidget, isDarkTheme
+    TableView, isDarkTheme
+)
+
+
+_HEADERS = (
+    "Ticket #",
+    "FS ID",
+    "Subject",
+    "Priority",
+    "Type",
+    "Category",
+    "Subcategory",
+    "Item",
+    "Team",
+    "Urgency",
+    "Impact",
+    "Status",
+    "Notes"
+)
+
+# (column, comparison key) for the expected → actual columns
+_COMP_COLS = (
+    (3, 'priority'), (4, 'type'), (5, 'category'), (6, 'sub_category'),
+    (7, 'item'), (8, 'group'), (9, 'urgency'), (10, 'impact')
 )
+_COMP_KEYS = dict(_COMP_COLS)
+_EMPTY = {}  # Shared stand-in for a missing comparison (never mutated)
+
+# Repeated cell texts
+_PASS_TEXT = "✓ PASS"
+_DASH = "-"
+_NOT_FOUND = "NOT FOUND"
+_STATUS_COLUMN = 11
+_NOTES_COLUMN = 12
+
+
+def _format_comparison(comparison: Dict) -> str:
+    """
+    Format expected vs actual comparison.
+
+    Args:
+        comparison: Comparison dict with 'expected', 'actual', 'match' keys
+
+    Returns:
+        Formatted string showing comparison
+    """
+    if not comparison:
+        return _DASH
+
+    expected = comparison.get('expected', 'N/A')
+    actual = comparison.get('actual', 'N/A')
+    match = comparison.get('match')
+
+    # If match is None, just show actual (discovery mode)
+    if match is None:
+        return str(actual)
+
+    # Show expected → actual with indicator
+    if match:
+        return f"✓ {actual}"
+    else:
+        return f"✗ {expected} → {actual}"
+
+
+def _get_ticket_notes(actual_ticket: Dict) -> str:
+    """
+    Extract notes from Freshservice ticket.
+
+    Args:
+        actual_ticket: Actual Freshservice ticket data
+
+    Returns:
+        Notes text or "-" if no notes
+    """
+    # Check for common note fields in Freshservice API
+    description = actual_ticket.get('description_text', '')
+    notes = actual_ticket.get('notes', [])
+
+    if notes and len(notes) > 0:
+        # Return first note
+        return notes[0].get('body_text', _DASH)
+    elif description:
+        # Return truncated description if no notes
+        return description[:100] + "..." if len(description) > 100 else description
+    else:
+        return _DASH
+
+
+def _format_status(result: Dict) -> str:
+    """
+    Format the overall status column for a found ticket.
+
+    Args:
+        result: Per-ticket verification result
+
+    Returns:
+        Status text
+    """
+    overall = result['overall_result']
+    if overall == 'PASS':
+        return _PASS_TEXT
+    elif overall == 'FAIL':
+        match_count = result['match_count']
+        mismatch_count = result['mismatch_count']
+        return f"✗ FAIL ({match_count} match, {mismatch_count} mismatch)"
+    return overall
+
+
+def _format_cell(result: Dict, column: int) -> str:
+    """
+    Format one cell of the results table.
+
+    Args:
+        result: Per-ticket verification result
+        column: Column index into _HEADERS
+
+    Returns:
+        Cell text
+    """
+    if column == 0:
+        return str(result['ticket_number'])
+    if column == 2:
+        return result['subject']
+
+    if result['status'] == 'NOT_FOUND':
+        # Not found in Freshservice
+        return _NOT_FOUND if column in (1, _STATUS_COLUMN) else _DASH
+
+    if column == 1:
+        return str(result['freshservice_id'])
+    if column == _STATUS_COLUMN:
+        return _format_status(result)
+    if column == _NOTES_COLUMN:
+        return _get_ticket_notes(result.get('actual', {}))
+
+    # Expected → Actual for the column's field
+    return _format_comparison(result['comparisons'].get(_COMP_KEYS[column], _EMPTY))
+
+
+class _FormatJob(QRunnable):
+    """
+    Formats every results-table cell in a background thread.
+
+    Signals are emitted via a Signals object since QRunnable doesn't inherit QObject.
+    """
+
+    class Signals(QObject):
+        """Signals for format job."""
+        finished = Signal(list)  # Per-column text lists
+
+    def __init__(self, results: List[Dict]):
+        """
+        Initialize format job.
+
+        Args:
+            results: Per-ticket verification results
+        """
+        super().__init__()
+        self.signals = self.Signals()
+        self._results = results
+        self._is_cancelled = False
+
+    def cancel(self):
+        """Request cancellation (no result is emitted)."""
+        self._is_cancelled = True
+
+    @Slot()
+    def run(self):
+        """Format all cells in background thread."""
+        columns = [[] for _ in _HEADERS]
+        for result in self._results:
+            if self._is_cancelled:
+                return
+            for column, texts in enumerate(columns):
+                texts.append(_format_cell(result, column))
+        self.signals.finished.emit(columns)
+
+
+class VerificationResultsModel(QAbstractTableModel):
+    """
+    Table model over per-ticket verification results.
+
+    Cell texts are formatted on first access and cached per column, so
+    only cells the view actually asks for pay the formatting cost.
+    """
+
+    def __init__(self, results: List[Dict], parent=None):
+        """
+        Initialize verification results model.
+
+        Args:
+            results: Per-ticket results from TicketVerifier.verify_batch()
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._results = results
+        self._columns = [[None] * len(results) for _ in _HEADERS]  # Formatted cell texts per column
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of results (0 for child indexes)."""
+        return 0 if parent.isValid() else len(self._results)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of columns (0 for child indexes)."""
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Cell text, formatted on first request."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        column = self._columns[index.column()]
+        text = column[index.row()]
+        if text is None:
+            text = column[index.row()] = _format_cell(self._results[index.row()], index.column())
+        return text
+
+    def set_formatted(self, columns: List[List[str]]):
+        """
+        Replace the text cache with fully formatted columns.
+
+        Args:
+            columns: Per-column cell texts for every row (from _FormatJob)
+        """
+        self._columns = columns
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Column titles."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _HEADERS[section]
+        return None
 
 
 class VerificationDialog(QDialog):
@@ -28,6 +259,8 @@ class VerificationDialog(QDialog):
     - Overall pass/fail status
     """
 
+    RESIZE_SAMPLE_ROWS = 100  # Rows sampled when sizing columns to contents
+
     def __init__(self, verification_results: Dict, parent: QWidget = None):
         """
         Initialize verification dialog.
@@ -69,6 +302,17 @@ class VerificationDialog(QDialog):
         close_button.setFixedWidth(100)
         layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignRight)
 
+        # Format the remaining cells off the UI thread so sorting and
+        # scrolling later hit the cache without stalling the dialog
+        self._format_job = _FormatJob(self.verification_results['results'])
+        self._format_job.signals.finished.connect(self._on_cells_formatted)
+        self.finished.connect(self._format_job.cancel)
+        QThreadPool.globalInstance().start(self._format_job)
+
+    def _on_cells_formatted(self, columns: list):
+        """Hand the background-formatted cells to the model."""
+        self.results_model.set_formatted(columns)
+
     def _create_summary_widget(self) -> QWidget:
         """Create summary statistics widget."""
         widget = QWidget()
@@ -117,115 +361,21 @@ class VerificationDialog(QDialog):
 
         return widget
 
-    def _create_results_table(self) -> TableWidget:
+    def _create_results_table(self) -> TableView:
         """Create detailed results table."""
-        table = TableWidget()
-
-        # Define columns
-        columns = [
-            "Ticket #",
-            "FS ID",
-            "Subject",
-            "Priority",
-            "Type",
-            "Category",
-            "Subcategory",
-            "Item",
-            "Team",
-            "Urgency",
-            "Impact",
-            "Status",
-            "Notes"
-        ]
-
-        results = self.verification_results['results']
-
-        table.setColumnCount(len(columns))
-        table.setRowCount(len(results))
-        table.setHorizontalHeaderLabels(columns)
-
-        # Populate table
-        for row_idx, result in enumerate(results):
-            # Ticket number
-            table.setItem(row_idx, 0, QTableWidgetItem(str(result['ticket_number'])))
-
-            if result['status'] == 'NOT_FOUND':
-                # Not found in Freshservice
-                table.setItem(row_idx, 1, QTableWidgetItem("NOT FOUND"))
-                table.setItem(row_idx, 2, QTableWidgetItem(result['subject']))
-                for col in range(3, len(columns) - 2):
-                    table.setItem(row_idx, col, QTableWidgetItem("-"))
-                table.setItem(row_idx, 11, QTableWidgetItem("NOT FOUND"))
-                table.setItem(row_idx, 12, QTableWidgetItem("-"))
-            else:
-                # Found - show details
-                comparisons = result['comparisons']
-                actual_ticket = result.get('actual', {})
-
-                # Freshservice ID
-                table.setItem(row_idx, 1, QTableWidgetItem(str(result['freshservice_id'])))
-
-                # Subject
-                table.setItem(row_idx, 2, QTableWidgetItem(result['subject']))
-
-                # Priority (Expected → Actual)
-                priority_comp = comparisons.get('priority', {})
-                priority_text = self._format_comparison(priority_comp)
-                table.setItem(row_idx, 3, QTableWidgetItem(priority_text))
-
-                # Type (Expected → Actual)
-                type_comp = comparisons.get('type', {})
-                type_text = self._format_comparison(type_comp)
-                table.setItem(row_idx, 4, QTableWidgetItem(type_text))
-
-                # Category
-                cat_comp = comparisons.get('category', {})
-                cat_text = self._format_comparison(cat_comp)
-                table.setItem(row_idx, 5, QTableWidgetItem(cat_text))
-
-                # Subcategory
-                subcat_comp = comparisons.get('sub_category', {})
-                subcat_text = self._format_comparison(subcat_comp)
-                table.setItem(row_idx, 6, QTableWidgetItem(subcat_text))
-
-                # Item
-                item_comp = comparisons.get('item', {})
-                item_text = self._format_comparison(item_comp)
-                table.setItem(row_idx, 7, QTableWidgetItem(item_text))
-
-                # Team (Group)
-                group_comp = comparisons.get('group', {})
-                group_text = self._format_comparison(group_comp)
-                table.setItem(row_idx, 8, QTableWidgetItem(group_text))
-
-                # Urgency
-                urgency_comp = comparisons.get('urgency', {})
-                urgency_text = self._format_comparison(urgency_comp)
-                table.setItem(row_idx, 9, QTableWidgetItem(urgency_text))
-
-                # Impact
-                impact_comp = comparisons.get('impact', {})
-                impact_text = self._format_comparison(impact_comp)
-                table.setItem(row_idx, 10, QTableWidgetItem(impact_text))
-
-                # Overall Status
-                overall = result['overall_result']
-                if overall == 'PASS':
-                    status_text = "✓ PASS"
-                elif overall == 'FAIL':
-                    match_count = result['match_count']
-                    mismatch_count = result['mismatch_count']
-                    status_text = f"✗ FAIL ({match_count} match, {mismatch_count} mismatch)"
-                else:
-                    status_text = overall
-                table.setItem(row_idx, 11, QTableWidgetItem(status_text))
-
-                # Notes (from Freshservice ticket)
-                notes = self._get_ticket_notes(actual_ticket)
-                table.setItem(row_idx, 12, QTableWidgetItem(notes))
-
-        # Adjust column widths
+        table = TableView()
+
+        # Cells are formatted lazily by the model; the proxy handles sorting
+        self.results_model = VerificationResultsModel(self.verification_results['results'], self)
+        proxy = QSortFilterProxyModel(self)
+        proxy.setSourceModel(self.results_model)
+        table.setModel(proxy)
+        table.verticalHeader().hide()
+
+        # Adjust column widths, sizing to the visible rows plus a sample
+        # rather than formatting every cell up front
         header = table.horizontalHeader()
+        header.setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Ticket #
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # FS ID
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)           # Subject
@@ -234,57 +384,8 @@ class VerificationDialog(QDialog):
         header.setSectionResizeMode(11, QHeaderView.ResizeMode.ResizeToContents)  # Status
         header.setSectionResizeMode(12, QHeaderView.ResizeMode.Stretch)           # Notes
 
-        # Enable sorting
+        # Enable sorting, keeping the verification order until a header is clicked
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         table.setSortingEnabled(True)
 
         return table
-
-    def _format_comparison(self, comparison: Dict) -> str:
-        """
-        Format expected vs actual comparison.
-
-        Args:
-            comparison: Comparison dict with 'expected', 'actual', 'match' keys
-
-        Returns:
-            Formatted string showing comparison
-        """
-        if not comparison:
-            return "-"
-
-        expected = comparison.get('expected', 'N/A')
-        actual = comparison.get('actual', 'N/A')
-        match = comparison.get('match')
-
-        # If match is None, just show actual (discovery mode)
-        if match is None:
-            return str(actual)
-
-        # Show expected → actual with indicator
-        if match:
-            return f"✓ {actual}"
-        else:
-            return f"✗ {expected} → {actual}"
-
-    def _get_ticket_notes(self, actual_ticket: Dict) -> str:
-        """
-        Extract notes from Freshservice ticket.
-
-        Args:
-            actual_ticket: Actual Freshservice ticket data
-
-        Returns:
-            Notes text or "-" if no notes
-        """
-        # Check for common note fields in Freshservice API
-        description = actual_ticket.get('description_text', '')
-        notes = actual_ticket.get('notes', [])
-
-        if notes and len(notes) > 0:
-            # Return first note
-            return notes[0].get('body_text', '-')
-        elif description:
-            # Return truncated description if no notes
-            return description[:100] + "..." if len(description) > 100 else description
-        else:
-            return "-"
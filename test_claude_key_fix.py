@@ -1,13 +1,14 @@
 """Test that Claude API key is retrieved correctly."""
 import sys
-from PySide6.QtWidgets import QApplication
-from pyside6_app.state.store import StateStore
-from pyside6_app.widgets.main_window_phase2 import MainWindow
-from pyside6_app.utils.theme import ThemeManager
 
 def test_claude_key():
     """Test that _get_claude_key() works correctly."""
-    app = QApplication(sys.argv)
+    from pyside6_app.testing import get_qapp
+    from pyside6_app.state.store import StateStore
+    from pyside6_app.widgets.main_window_phase2 import MainWindow
+    from pyside6_app.utils.theme import ThemeManager
+
+    get_qapp()
 
     try:
         store = StateStore()
@@ -34,13 +35,7 @@ def test_claude_key():
         print(f"[ERROR] AttributeError: {e}")
         print("This means the code is still trying to access claude_api_key from wrong object")
         return 1
-    except Exception as e:
-        print(f"[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    finally:
-        app.quit()
 
 if __name__ == "__main__":
-    sys.exit(test_claude_key())
+    from pyside6_app.testing import run_test
+    sys.exit(run_test(test_claude_key))
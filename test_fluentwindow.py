@@ -1,20 +1,28 @@
 """Test FluentWindow creation."""
 import sys
-from PySide6.QtWidgets import QApplication
-from qfluentwidgets import FluentWindow
 
-print("Creating QApplication...")
-app = QApplication(sys.argv)
-print("  OK")
 
-print("Creating FluentWindow...")
-window = FluentWindow()
-print("  OK")
+def main():
+    """Create and show a bare FluentWindow."""
+    from PySide6.QtWidgets import QApplication
+    from qfluentwidgets import FluentWindow
 
-print("Setting window title...")
-window.setWindowTitle("Test")
-print("  OK")
+    print("Creating QApplication...")
+    app = QApplication(sys.argv)
+    print("  OK")
 
-print("Success!")
-window.show()
-sys.exit(app.exec())
+    print("Creating FluentWindow...")
+    window = FluentWindow()
+    print("  OK")
+
+    print("Setting window title...")
+    window.setWindowTitle("Test")
+    print("  OK")
+
+    print("Success!")
+    window.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,72 @@
 """Test MainWindow initialization step by step."""
 import sys
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QObject
 
-# Create QApp first
-app = QApplication(sys.argv)
-print("QApplication created")
 
-# Import after QApp
-from qfluentwidgets import FluentWindow
-from pyside6_app.state.store import StateStore
-from pyside6_app.utils.theme import ThemeManager
+def main():
+    """Create FluentWindow, a minimal subclass and MainWindow in turn."""
+    from pyside6_app.testing import get_qapp
 
-print("Creating StateStore...")
-state_store = StateStore()
-print("  OK")
+    # Create QApp first
+    app = get_qapp()
+    print("QApplication created")
 
-print("Creating ThemeManager...")
-theme_manager = ThemeManager()
-print("  OK")
+    # Import after QApp
+    from PySide6.QtCore import QEvent
+    from qfluentwidgets import FluentWindow
+    from pyside6_app.state.store import StateStore
+    from pyside6_app.utils.theme import ThemeManager
 
-# Test creating a bare FluentWindow
-print("\nTest 1: Create bare FluentWindow...")
-try:
-    test_window = FluentWindow()
-    print("  OK - FluentWindow works!")
-    test_window.close()
-except Exception as e:
-    print(f"  FAILED: {e}")
+    print("Creating StateStore...")
+    state_store = StateStore()
+    print("  OK")
 
-# Now test our custom MainWindow but with minimal init
-print("\nTest 2: Create MainWindow subclass with minimal init...")
+    print("Creating ThemeManager...")
+    theme_manager = ThemeManager()
+    print("  OK")
 
-class MinimalWindow(FluentWindow):
-    def __init__(self):
-        print("  - Calling super().__init__()...")
-        super().__init__()
-        print("  - super().__init__() completed")
+    class MinimalWindow(FluentWindow):
+        def __init__(self):
+            print("  - Calling super().__init__()...")
+            super().__init__()
+            print("  - super().__init__() completed")
 
-try:
-    minimal = MinimalWindow()
-    print("  OK - MinimalWindow works!")
-    minimal.close()
-except Exception as e:
-    print(f"  FAILED: {e}")
-    import traceback
-    traceback.print_exc()
+    def create_main_window():
+        from pyside6_app.widgets.main_window_phase2 import MainWindow
+        print("  - Imported MainWindow")
 
-# Test with our actual imports
-print("\nTest 3: Import and create actual MainWindow...")
-try:
-    from pyside6_app.widgets.main_window_phase2 import MainWindow
-    print("  - Imported MainWindow")
+        print("  - Creating MainWindow instance...")
+        return MainWindow(state_store, theme_manager)
 
-    print("  - Creating MainWindow instance...")
-    main_window = MainWindow(state_store, theme_manager)
-    print("  OK - MainWindow created!")
+    # Probes from lightest to heaviest; the last is the real MainWindow
+    probes = (
+        ("Test 1: Create bare FluentWindow...", FluentWindow),
+        ("Test 2: Create MainWindow subclass with minimal init...", MinimalWindow),
+        ("Test 3: Import and create actual MainWindow...", create_main_window),
+    )
 
-    main_window.show()
-    sys.exit(app.exec())
+    window = None
+    for title, factory in probes:
+        if window is not None:
+            # Free the previous probe's widget tree before building the next
+            window.close()
+            window.deleteLater()
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
 
-except Exception as e:
-    print(f"  FAILED: {e}")
-    import traceback
-    traceback.print_exc()
+        print(f"\n{title}")
+        try:
+            window = factory()
+            print(f"  OK - {type(window).__name__} created!")
+        except Exception as e:
+            window = None
+            print(f"  FAILED: {e}")
+            import traceback
+            traceback.print_exc()
+
+    # Keep the real MainWindow open
+    if window is not None:
+        window.show()
+        sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,83 +1,74 @@
 """Test migration from .env.local file."""
 import sys
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from pyside6_app.state.store import StateStore
 
 def test_migration():
     """Test that migration loads all config from .env.local."""
-    app = QApplication(sys.argv)
+    from pyside6_app.testing import get_state_store
 
-    try:
-        # Create state store
-        store = StateStore()
+    # Shared state store
+    store = get_state_store()
 
-        # Manually trigger migration from .env.local
-        env_file = Path(".env.local")
-        if env_file.exists():
-            print(f"[INFO] Running migration from {env_file}...")
-            if store.migrate_from_env(env_file):
-                print("[OK] Migration successful!")
-            else:
-                print("[ERROR] Migration failed!")
-                return 1
+    # Manually trigger migration from .env.local
+    env_file = Path(".env.local")
+    if env_file.exists():
+        print(f"[INFO] Running migration from {env_file}...")
+        if store.migrate_from_env(env_file, force=True):
+            print("[OK] Migration successful!")
         else:
-            print("[ERROR] .env.local file not found!")
+            print("[ERROR] Migration failed!")
             return 1
+    else:
+        print("[ERROR] .env.local file not found!")
+        return 1
 
-        # Check if appstate.json exists now
-        appstate_file = store.config_dir / "appstate.json"
-        print(f"\n[INFO] AppState file: {appstate_file}")
-        print(f"[INFO] File exists: {appstate_file.exists()}")
-
-        # Check migrated values
-        state = store.state
-
-        print("\n[Microsoft 365 Configuration]")
-        print(f"  Client ID: {state.connections.microsoft.client_id}")
-        print(f"  Tenant ID: {state.connections.microsoft.tenant_id}")
-        print(f"  Sender: {state.connections.microsoft.sender_email}")
-        print(f"  Recipient: {state.connections.microsoft.recipient_email}")
-
-        print("\n[Claude API Configuration]")
-        print(f"  API Key (last 4): {state.connections.claude.api_key_last_four}")
-        print(f"  Is Configured: {state.connections.claude.is_configured}")
+    # appstate.json is now newer than .env.local, so a repeat is skipped
+    saved_mtime = store.state_file.stat().st_mtime
+    if not store.migrate_from_env(env_file) or store.state_file.stat().st_mtime != saved_mtime:
+        print("[ERROR] Repeat migration was not skipped!")
+        return 1
+    print("[OK] Repeat migration skipped (appstate.json up to date)")
 
-        print("\n[Freshservice Configuration]")
-        print(f"  Domain: {state.connections.freshservice.domain}")
-        print(f"  API Key (last 4): {state.connections.freshservice.api_key_last_four}")
+    # Check if appstate.json exists now
+    appstate_file = store.config_dir / "appstate.json"
 
-        # Validation
-        errors = []
-        if not state.connections.microsoft.client_id:
-            errors.append("Missing Client ID")
-        if not state.connections.microsoft.tenant_id:
-            errors.append("Missing Tenant ID")
-        if not state.connections.microsoft.sender_email:
-            errors.append("Missing Sender Email")
-        if not state.connections.microsoft.recipient_email:
-            errors.append("Missing Recipient Email")
-        if not state.connections.claude.api_key_last_four:
-            errors.append("Missing Claude API Key")
-        if not state.connections.freshservice.domain:
-            errors.append("Missing Freshservice Domain")
+    # Check migrated values, building the report to write in one go
+    conns = store.state.connections
+    lines = [
+        f"\n[INFO] AppState file: {appstate_file}",
+        f"[INFO] File exists: {appstate_file.exists()}",
+        "\n[Microsoft 365 Configuration]",
+        f"  Client ID: {conns.microsoft.client_id}",
+        f"  Tenant ID: {conns.microsoft.tenant_id}",
+        f"  Sender: {conns.microsoft.sender_email}",
+        f"  Recipient: {conns.microsoft.recipient_email}",
+        "\n[Claude API Configuration]",
+        f"  API Key (last 4): {conns.claude.api_key_last_four}",
+        f"  Is Configured: {conns.claude.is_configured}",
+        "\n[Freshservice Configuration]",
+        f"  Domain: {conns.freshservice.domain}",
+        f"  API Key (last 4): {conns.freshservice.api_key_last_four}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-        if errors:
-            print("\n[ERRORS]")
-            for error in errors:
-                print(f"  - {error}")
-            return 1
-        else:
-            print("\n[OK] All configuration loaded successfully!")
-            return 0
+    # Validation
+    checks = (
+        (conns.microsoft.client_id, "Client ID"),
+        (conns.microsoft.tenant_id, "Tenant ID"),
+        (conns.microsoft.sender_email, "Sender Email"),
+        (conns.microsoft.recipient_email, "Recipient Email"),
+        (conns.claude.api_key_last_four, "Claude API Key"),
+        (conns.freshservice.domain, "Freshservice Domain"),
+    )
+    errors = [f"Missing {name}" for value, name in checks if not value]
 
-    except Exception as e:
-        print(f"[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
+    if errors:
+        sys.stdout.write("\n[ERRORS]\n" + "".join(f"  - {error}\n" for error in errors))
         return 1
-    finally:
-        app.quit()
+    else:
+        print("\n[OK] All configuration loaded successfully!")
+        return 0
 
 if __name__ == "__main__":
-    sys.exit(test_migration())
+    from pyside6_app.testing import run_test
+    sys.exit(run_test(test_migration))
@@ -1,29 +1,28 @@
 """Test QApplication scope issue."""
 import sys
 
-# Check if QApplication already exists
-from PySide6.QtWidgets import QApplication
-existing = QApplication.instance()
-print(f"Existing QApplication: {existing}")
 
-if existing is None:
-    print("Creating new QApplication...")
-    app = QApplication(sys.argv)
-    print(f"  Created: {app}")
-else:
-    print("Using existing QApplication")
-    app = existing
+def main():
+    """Create a FluentWindow after reusing or creating the QApplication."""
+    # Reuse the QApplication if one already exists
+    from pyside6_app.testing import get_qapp
+    app = get_qapp()
+    print(f"QApplication: {app}")
 
-print("\nNow importing FluentWindow...")
-from qfluentwidgets import FluentWindow
+    print("\nNow importing FluentWindow...")
+    from qfluentwidgets import FluentWindow
 
-print("Creating FluentWindow...")
-try:
-    window = FluentWindow()
-    print("  OK - FluentWindow created!")
-    window.show()
-    sys.exit(app.exec())
-except Exception as e:
-    print(f"  ERROR: {e}")
-    import traceback
-    traceback.print_exc()
+    print("Creating FluentWindow...")
+    try:
+        window = FluentWindow()
+        print("  OK - FluentWindow created!")
+        window.show()
+        sys.exit(app.exec())
+    except Exception as e:
+        print(f"  ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
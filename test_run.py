@@ -1,9 +1,20 @@
+import os
+import runpy
 import sys
 print("Starting app test...")
 try:
-    from pyside6_app.app import main
-    print("Imported main successfully")
-    main()
+    # Run app.py as a script so its __main__ guard (not an import) starts the app
+    if os.environ.get("PROFILE_STARTUP"):
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(runpy.run_module, "pyside6_app.app", run_name="__main__")
+        finally:
+            # main() leaves via sys.exit(), so print the stats on the way out
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(40)
+    else:
+        runpy.run_module("pyside6_app.app", run_name="__main__")
 except Exception as e:
     print(f"Error: {e}")
     import traceback
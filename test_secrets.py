@@ -1,44 +1,41 @@
 """Test that secrets are loaded from .env.local."""
 import sys
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
-from pyside6_app.state.store import StateStore
+
+def mask(key):
+    """Mask all but the last four characters of a secret."""
+    return key[-4:].rjust(len(key), '*') if key else 'Not found'
 
 def test_secrets():
     """Test that API keys are loaded into secure memory."""
-    app = QApplication(sys.argv)
-
-    try:
-        store = StateStore()
+    from pyside6_app.testing import get_state_store
 
-        # Check secrets in memory
-        claude_key = store.get_secret('claude_api_key')
-        fs_key = store.get_secret('freshservice_api_key')
+    store = get_state_store()
 
-        print("[Secrets in Memory]")
-        print(f"  Claude API Key: {'*' * (len(claude_key) - 4) + claude_key[-4:] if claude_key else 'Not found'}")
-        print(f"  Freshservice API Key: {'*' * (len(fs_key) - 4) + fs_key[-4:] if fs_key else 'Not found'}")
+    # Check secrets in memory
+    claude_key = store.get_secret('claude_api_key')
+    fs_key = store.get_secret('freshservice_api_key')
 
+    # Build the report and write it in one go
+    lines = [
+        "[Secrets in Memory]",
+        f"  Claude API Key: {mask(claude_key)}",
+        f"  Freshservice API Key: {mask(fs_key)}",
         # Check state (should only have last 4 chars)
-        print("\n[State Storage (appstate.json)]")
-        print(f"  Claude last 4: {store.state.connections.claude.api_key_last_four}")
-        print(f"  Claude configured: {store.state.connections.claude.is_configured}")
-        print(f"  Freshservice last 4: {store.state.connections.freshservice.api_key_last_four}")
-
-        if claude_key and fs_key:
-            print("\n[OK] All secrets loaded successfully!")
-            return 0
-        else:
-            print("\n[ERROR] Some secrets missing!")
-            return 1
-
-    except Exception as e:
-        print(f"[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
+        "\n[State Storage (appstate.json)]",
+        f"  Claude last 4: {store.state.connections.claude.api_key_last_four}",
+        f"  Claude configured: {store.state.connections.claude.is_configured}",
+        f"  Freshservice last 4: {store.state.connections.freshservice.api_key_last_four}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if claude_key and fs_key:
+        print("\n[OK] All secrets loaded successfully!")
+        return 0
+    else:
+        print("\n[ERROR] Some secrets missing!")
         return 1
-    finally:
-        app.quit()
 
 if __name__ == "__main__":
-    sys.exit(test_secrets())
+    from pyside6_app.testing import run_test
+    sys.exit(run_test(test_secrets))
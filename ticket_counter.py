@@ -2,18 +2,100 @@
 Persistent ticket counter to track ticket numbers across sessions.
 """
 
-import os
-import json
+import atexit
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Resolved once, beside this module, so every process shares one counter
+_DEFAULT_PATH = Path(__file__).with_name("ticket_counter.txt")
 
 
 class TicketCounter:
     """Manages persistent ticket numbering across sessions."""
 
-    COUNTER_FILE = "ticket_counter.json"
+    COUNTER_FILE = _DEFAULT_PATH.name  # Plain last-used number
+    LEGACY_COUNTER_FILE = "ticket_counter.json"  # Older {"last_ticket_number": n} format
+    BLOCK_SIZE = 100  # Numbers reserved on disk per write
+    RECORD_WIDTH = 20  # Saves overwrite a fixed-width record in place
+
+    __slots__ = ("current_number", "reserved_until", "_path", "_fh", "_finalized")
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the counter.
 
-    def __init__(self):
-        self.counter_file = self.COUNTER_FILE
+        Args:
+            path: Counter file (default: next to this module)
+        """
+        self._path = Path(path) if path else None  # None: use _DEFAULT_PATH
+        self._fh = None  # Opened on first save, closed in finalize
+        self._finalized = True  # No reservation left to release
         self.current_number = self.load_counter()
+        # Last number covered by the on-disk reservation; numbers are handed
+        # out from memory until it runs out, so a crash never reuses one
+        self.reserved_until = self.current_number - 1
+        self._reserve(self.current_number)
+        # Release the unused reservation on exit if the caller didn't
+        atexit.register(self.finalize)
+
+    @property
+    def counter_file(self) -> Path:
+        """Path of the counter file."""
+        return self._path or _DEFAULT_PATH
+
+    @property
+    def legacy_file(self) -> Path:
+        """Path of the older JSON counter file, read only for migration."""
+        return self.counter_file.with_name(self.LEGACY_COUNTER_FILE)
+
+    @classmethod
+    def counter_paths(cls, path: Optional[Path] = None) -> Tuple[Path, ...]:
+        """
+        Get the files a counter is read from, in lookup order.
+
+        For the default location this includes the files older versions kept
+        in the working directory, so their count carries over once.
+
+        Args:
+            path: Counter file (default: next to this module)
+
+        Returns:
+            Counter file, its legacy JSON file, then any working-directory files
+        """
+        counter_file = Path(path) if path else _DEFAULT_PATH
+        paths = (counter_file, counter_file.with_name(cls.LEGACY_COUNTER_FILE))
+        if path is None and Path.cwd().resolve() != counter_file.parent.resolve():
+            paths += (Path.cwd() / cls.COUNTER_FILE, Path.cwd() / cls.LEGACY_COUNTER_FILE)
+        return paths
+
+    @classmethod
+    def read_last_number(cls, path: Optional[Path] = None) -> Optional[int]:
+        """
+        Read the last used ticket number without reserving any.
+
+        Args:
+            path: Counter file (default: next to this module)
+
+        Returns:
+            Last used number, or None if no counter file exists or it is unreadable
+        """
+        for counter_file in cls.counter_paths(path):
+            try:
+                with counter_file.open('r') as f:
+                    text = f.read().strip()
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return None
+
+            try:
+                if text.startswith('{'):
+                    import json  # Legacy format only
+                    return json.loads(text).get('last_ticket_number', 0)
+                return int(text)
+            except ValueError:
+                return None
+        return None
 
     def load_counter(self) -> int:
         """
@@ -22,14 +104,8 @@ class TicketCounter:
         Returns:
             Current ticket number (starts at 1 if file doesn't exist)
         """
-        if os.path.exists(self.counter_file):
-            try:
-                with open(self.counter_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('last_ticket_number', 0) + 1
-            except (json.JSONDecodeError, IOError):
-                return 1
-        return 1
+        last_number = self.read_last_number(self._path)
+        return last_number + 1 if last_number is not None else 1
 
     def save_counter(self, last_number: int):
         """
@@ -39,13 +115,37 @@ class TicketCounter:
             last_number: The last ticket number used
         """
         try:
-            with open(self.counter_file, 'w') as f:
-                json.dump({
-                    'last_ticket_number': last_number
-                }, f)
-        except IOError as e:
+            if self._fh is None:
+                try:
+                    self._fh = self.counter_file.open('r+')
+                except FileNotFoundError:
+                    self._fh = self.counter_file.open('w+')
+            # Same-length overwrite, so the file is never left empty or partial
+            self._fh.seek(0)
+            self._fh.write(str(last_number).ljust(self.RECORD_WIDTH))
+            self._fh.truncate()  # Drop any longer leftover record
+            self._fh.flush()
+        except OSError as e:
             print(f"Warning: Could not save ticket counter: {e}")
 
+    def _close(self):
+        """Close the counter file handle if it is open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _reserve(self, number: int):
+        """
+        Extend the on-disk reservation by BLOCK_SIZE if it doesn't cover number.
+
+        Args:
+            number: Ticket number about to be handed out
+        """
+        if number > self.reserved_until:
+            self.reserved_until = number + self.BLOCK_SIZE - 1
+            self.save_counter(self.reserved_until)
+            self._finalized = False
+
     def get_next_number(self) -> int:
         """
         Get the next ticket number.
@@ -54,6 +154,7 @@ class TicketCounter:
             Next ticket number
         """
         number = self.current_number
+        self._reserve(number)
         self.current_number += 1
         return number
 
@@ -69,16 +170,23 @@ class TicketCounter:
         """
         start = self.current_number
         end = self.current_number + count - 1
+        self._reserve(end)
         self.current_number = end + 1
         return (start, end)
 
     def finalize(self):
-        """Save the current counter state to file."""
-        self.save_counter(self.current_number - 1)
+        """Save the current counter state to file, releasing unused reserved numbers."""
+        if self._finalized:
+            return
+        self._finalized = True
+        self.reserved_until = self.current_number - 1
+        self.save_counter(self.reserved_until)
+        self._close()
 
     def reset(self):
         """Reset counter to 1 (mainly for testing)."""
         self.current_number = 1
+        self.reserved_until = 0
         self.save_counter(0)
 
     def get_current(self) -> int:
@@ -3,8 +3,9 @@ Ticket Verification System
 Compares sent emails with created Freshservice tickets to verify correct categorization.
 """
 
-from typing import List, Dict, Tuple, Optional
-from datetime import datetime
+from typing import List, Dict, Tuple, Optional, Iterator, FrozenSet
+from collections import deque
+from datetime import datetime, timedelta
 import re
 from freshservice_client import FreshserviceClient
 
@@ -48,6 +49,23 @@ class TicketVerifier:
         'Priority 4': {'urgency': 1, 'impact': 1}   # Low/Low
     }
 
+    # Known group mappings - these are the ONLY valid groups
+    GROUP_MAP = {
+        76000128925: 'Service Desk Team',
+        76000128926: 'Infrastructure Team',
+        76000128927: 'Application Team',  # Fixed typo: was "Applications Team"
+        76000138755: 'Enterprise Technology',
+        76000165188: 'Lightbulbs',
+        76000209739: 'People & Safety Systems'
+    }
+    VALID_GROUP_IDS = frozenset(GROUP_MAP)
+
+    # Test ticket number in a subject, e.g. "[TEST-TKT-42] Printer offline"
+    _PREFIX_RE = re.compile(r'\[TEST-TKT-([^\]]+)\]')
+
+    # Separator between category levels, e.g. "Application Support > Frameworks"
+    _CAT_RE = re.compile(r'\s*>\s*')
+
     def __init__(self, fs_client: FreshserviceClient):
         """
         Initialize verifier.
@@ -57,6 +75,13 @@ class TicketVerifier:
         """
         self.fs_client = fs_client
 
+        # Expected urgency/impact (display text), priority number and
+        # valid urgency/impact values per priority name
+        self._priority_cache = {
+            priority: self._priority_expectations(priority)
+            for priority in self.PRIORITY_TO_URGENCY_IMPACT
+        }
+
     def verify_batch(
         self,
         sent_emails: List[Dict],
@@ -78,36 +103,70 @@ class TicketVerifier:
         Returns:
             Dictionary with verification results
         """
+        verification_results = list(self.verify_batch_iter(
+            sent_emails,
+            recipient_email,
+            batch_start_time,
+            expected_group,
+            sender_email
+        ))
+        return self.build_batch_report(verification_results, sent_emails, batch_start_time)
+
+    def verify_batch_iter(
+        self,
+        sent_emails: List[Dict],
+        recipient_email: str,
+        batch_start_time: datetime,
+        expected_group: Optional[str] = None,
+        sender_email: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Verify a batch of sent emails, yielding one result per sent email.
+
+        Freshservice tickets are fetched once up front (matching needs the
+        whole pool); results are then yielded as each email is compared.
+
+        Args:
+            sent_emails: List of sent email dictionaries with expected values
+            recipient_email: Email address that received the tickets (for logging only)
+            batch_start_time: When the batch started
+            expected_group: Expected assignment group name
+            sender_email: Email address that sent the emails (becomes the Freshservice requester)
+
+        Yields:
+            Per-email verification result dictionaries, in sent order
+        """
         # Format timestamp for Freshservice API
         timestamp_str = self.fs_client.format_timestamp(batch_start_time)
 
         # IMPORTANT: Freshservice's 'email' parameter filters by REQUESTER email (the sender),
         # NOT the recipient email. When we know the sender's email, we can use it for filtering.
 
+        # Method 1: Tickets since the batch started (by sender email if known)
         if sender_email:
-            print(f"Fetching tickets for requester {sender_email} since {timestamp_str}...")
-            # Method 1: Get tickets by sender email + timestamp
-            fs_tickets = self.fs_client.get_tickets_by_email(sender_email, timestamp_str)
-            print(f"Found {len(fs_tickets)} tickets by email + timestamp filter")
+            queries = [(f"Fetching tickets for requester {sender_email} since {timestamp_str}...",
+                        timestamp_str, "Found {} tickets by email + timestamp filter")]
         else:
-            print(f"Fetching tickets since {timestamp_str}...")
-            # Method 1: Get all tickets by timestamp (no email filter)
-            fs_tickets = self.fs_client.get_tickets_by_email(None, timestamp_str)
-            print(f"Found {len(fs_tickets)} tickets by timestamp filter")
+            queries = [(f"Fetching tickets since {timestamp_str}...",
+                        timestamp_str, "Found {} tickets by timestamp filter")]
 
         # Method 2: If no tickets found, broaden the search (last 24 hours)
-        if not fs_tickets and sent_emails:
-            print("No tickets found with batch timestamp, trying last 24 hours...")
-            from datetime import timedelta
+        if sent_emails:
             yesterday = self.fs_client.format_timestamp(batch_start_time - timedelta(hours=24))
-            fs_tickets = self.fs_client.get_tickets_by_email(sender_email, yesterday)
-            print(f"Found {len(fs_tickets)} tickets in last 24 hours")
+            queries.append(("No tickets found with batch timestamp, trying last 24 hours...",
+                            yesterday, "Found {} tickets in last 24 hours"))
 
         # Method 3: If still nothing, get ALL recent tickets for this sender
-        if not fs_tickets:
-            print("No tickets found with timestamp filter, getting all recent tickets...")
-            fs_tickets = self.fs_client.get_tickets_by_email(sender_email, None)
-            print(f"Found {len(fs_tickets)} total recent tickets")
+        queries.append(("No tickets found with timestamp filter, getting all recent tickets...",
+                        None, "Found {} total recent tickets"))
+
+        # Each broader query only runs if the narrower one found nothing
+        for message, updated_since, found_message in queries:
+            print(message)
+            fs_tickets = self.fs_client.get_tickets_by_email(sender_email, updated_since)
+            print(found_message.format(len(fs_tickets)))
+            if fs_tickets:
+                break
 
         # Debug: Show subjects of found tickets
         if fs_tickets:
@@ -123,24 +182,24 @@ class TicketVerifier:
             prefix = f"[TEST-TKT-{sent_email['number']}]"
             print(f"  - {prefix}")
 
-        # Match tickets to sent emails
-        verification_results = []
-        matched_fs_tickets = set()
+        # Index Freshservice tickets by test ticket number, in fetch order
+        # (each ticket ID once, so it can only be matched to one email)
+        by_number = {}
+        indexed_ids = set()
+        for fs_ticket in fs_tickets:
+            match = self._PREFIX_RE.search(fs_ticket.get('subject') or '')
+            if match and fs_ticket['id'] not in indexed_ids:
+                indexed_ids.add(fs_ticket['id'])
+                by_number.setdefault(match.group(1), deque()).append(fs_ticket)
 
+        # Match tickets to sent emails
         for sent_email in sent_emails:
             ticket_num = sent_email['number']
             expected_subject = sent_email['subject']
 
-            # Find matching Freshservice ticket by subject prefix
-            prefix = f"[TEST-TKT-{ticket_num}]"
-            matching_ticket = None
-
-            for fs_ticket in fs_tickets:
-                fs_subject = fs_ticket.get('subject', '')
-                if prefix in fs_subject and fs_ticket['id'] not in matched_fs_tickets:
-                    matching_ticket = fs_ticket
-                    matched_fs_tickets.add(fs_ticket['id'])
-                    break
+            # Take the first unmatched Freshservice ticket with this number
+            candidates = by_number.get(str(ticket_num))
+            matching_ticket = candidates.popleft() if candidates else None
 
             if matching_ticket:
                 # Compare ticket fields
@@ -149,10 +208,10 @@ class TicketVerifier:
                     matching_ticket,
                     expected_group
                 )
-                verification_results.append(comparison)
+                yield comparison
             else:
                 # Ticket not found
-                verification_results.append({
+                yield {
                     'ticket_number': ticket_num,
                     'status': 'NOT_FOUND',
                     'freshservice_id': None,
@@ -162,8 +221,25 @@ class TicketVerifier:
                     'match_count': 0,
                     'mismatch_count': 0,
                     'expected': sent_email
-                })
+                }
 
+    def build_batch_report(
+        self,
+        verification_results: List[Dict],
+        sent_emails: List[Dict],
+        batch_start_time: datetime
+    ) -> Dict:
+        """
+        Build the verify_batch() result dictionary from per-email results.
+
+        Args:
+            verification_results: Results from verify_batch_iter()
+            sent_emails: Sent email dictionaries that were verified
+            batch_start_time: When the batch started
+
+        Returns:
+            Dictionary with verification results
+        """
         # Generate summary statistics
         summary = self._generate_summary(verification_results)
 
@@ -173,8 +249,8 @@ class TicketVerifier:
             'batch_start_time': batch_start_time,
             'verification_time': datetime.now(),
             'total_sent': len(sent_emails),
-            'total_found': len([r for r in verification_results if r['status'] == 'FOUND']),
-            'total_not_found': len([r for r in verification_results if r['status'] == 'NOT_FOUND'])
+            'total_found': summary['found'],
+            'total_not_found': summary['not_found']
         }
 
     def _compare_ticket(
@@ -216,10 +292,8 @@ class TicketVerifier:
             expected_category = sent_email['category']  # e.g., "Application Support > Frameworks > Support"
 
             # Parse category hierarchy
-            category_parts = [part.strip() for part in expected_category.split('>')]
-            expected_cat = category_parts[0] if len(category_parts) > 0 else None
-            expected_subcat = category_parts[1] if len(category_parts) > 1 else None
-            expected_item = category_parts[2] if len(category_parts) > 2 else None
+            category_parts = self._CAT_RE.split(expected_category.strip())
+            expected_cat, expected_subcat, expected_item = (category_parts + [None, None, None])[:3]
 
         # Get actual Freshservice values
         fs_priority = fs_ticket.get('priority')      # 1, 2, 3, or 4
@@ -291,8 +365,13 @@ class TicketVerifier:
             }
         else:
             # Normal mode: Compare expected vs actual
+            (expected_urgency, expected_impact, expected_priority_num,
+             valid_urgencies, valid_impacts) = (
+                self._priority_cache.get(expected_priority)
+                or self._priority_expectations(expected_priority)
+            )
+
             # Compare Priority
-            expected_priority_num = self._priority_name_to_number(expected_priority)
             priority_match = (fs_priority == expected_priority_num)
             comparisons['priority'] = {
                 'expected': expected_priority,
@@ -305,8 +384,7 @@ class TicketVerifier:
                 mismatch_count += 1
 
             # Compare Urgency (based on priority matrix)
-            expected_urgency = self._get_expected_urgency_from_priority(expected_priority)
-            urgency_match = self._check_urgency_match(expected_urgency, fs_urgency)
+            urgency_match = fs_urgency in valid_urgencies
             comparisons['urgency'] = {
                 'expected': expected_urgency,
                 'actual': self.FS_URGENCY_MAP.get(fs_urgency, f'Unknown ({fs_urgency})'),
@@ -318,8 +396,7 @@ class TicketVerifier:
                 mismatch_count += 1
 
             # Compare Impact
-            expected_impact = self._get_expected_impact_from_priority(expected_priority)
-            impact_match = self._check_impact_match(expected_impact, fs_impact)
+            impact_match = fs_impact in valid_impacts
             comparisons['impact'] = {
                 'expected': expected_impact,
                 'actual': self.FS_IMPACT_MAP.get(fs_impact, f'Unknown ({fs_impact})'),
@@ -378,11 +455,7 @@ class TicketVerifier:
             else:
                 mismatch_count += 1
 
-        # Validate Group Assignment - must be one of the valid groups
-        # Valid groups: Service Desk Team, Infrastructure Team, Application Team,
-        # Enterprise Technology, Lightbulbs, People & Safety Systems
-        VALID_GROUP_IDS = {76000128925, 76000128926, 76000128927, 76000138755, 76000165188, 76000209739}
-
+        # Validate Group Assignment - must be one of the valid groups (GROUP_MAP)
         if discovery_mode:
             # In discovery mode, just report the group without validation
             if fs_group_id is not None:
@@ -403,7 +476,7 @@ class TicketVerifier:
             if fs_group_id is not None:
                 group_name = self._get_group_name(fs_group_id)
                 # Check if group is one of the valid groups
-                is_valid_group = fs_group_id in VALID_GROUP_IDS
+                is_valid_group = fs_group_id in self.VALID_GROUP_IDS
 
                 comparisons['group'] = {
                     'expected': 'One of 6 valid groups',
@@ -442,6 +515,19 @@ class TicketVerifier:
             'actual': fs_ticket
         }
 
+    def _priority_expectations(
+        self,
+        priority: str
+    ) -> Tuple[str, str, int, FrozenSet[int], FrozenSet[int]]:
+        """Get expected urgency/impact text, priority number and valid urgency/impact values."""
+        return (
+            self._get_expected_urgency_from_priority(priority),
+            self._get_expected_impact_from_priority(priority),
+            self._priority_name_to_number(priority),
+            self._get_valid_values_from_priority(priority, 'urgency'),
+            self._get_valid_values_from_priority(priority, 'impact')
+        )
+
     def _priority_name_to_number(self, priority_name: str) -> int:
         """Convert priority name to Freshservice number."""
         mapping = {
@@ -474,23 +560,14 @@ class TicketVerifier:
             return self.FS_IMPACT_MAP[mapping['impact']]
         return 'Unknown'
 
-    def _check_urgency_match(self, expected: str, actual: int) -> bool:
-        """Check if urgency matches (handling 'or' cases)."""
-        if ' or ' in expected:
-            valid_values = expected.split(' or ')
-            actual_str = self.FS_URGENCY_MAP.get(actual, '')
-            return actual_str in valid_values
-        else:
-            return expected == self.FS_URGENCY_MAP.get(actual, '')
-
-    def _check_impact_match(self, expected: str, actual: int) -> bool:
-        """Check if impact matches (handling 'or' cases)."""
-        if ' or ' in expected:
-            valid_values = expected.split(' or ')
-            actual_str = self.FS_IMPACT_MAP.get(actual, '')
-            return actual_str in valid_values
-        else:
-            return expected == self.FS_IMPACT_MAP.get(actual, '')
+    def _get_valid_values_from_priority(self, priority: str, field: str) -> FrozenSet[int]:
+        """Get the Freshservice values of field ('urgency' or 'impact') valid for a priority."""
+        mapping = self.PRIORITY_TO_URGENCY_IMPACT.get(priority)
+        if isinstance(mapping, list):
+            return frozenset(m[field] for m in mapping)
+        elif isinstance(mapping, dict):
+            return frozenset((mapping[field],))
+        return frozenset()
 
     def _get_group_name(self, group_id: int) -> str:
         """
@@ -502,56 +579,58 @@ class TicketVerifier:
         Returns:
             Group name or 'Unknown Group'
         """
-        # Known group mappings - these are the ONLY valid groups
-        group_map = {
-            76000128925: 'Service Desk Team',
-            76000128926: 'Infrastructure Team',
-            76000128927: 'Application Team',  # Fixed typo: was "Applications Team"
-            76000138755: 'Enterprise Technology',
-            76000165188: 'Lightbulbs',
-            76000209739: 'People & Safety Systems'
-        }
-        return group_map.get(group_id, f'Unknown Group (ID: {group_id})')
+        return self.GROUP_MAP.get(group_id, f'Unknown Group (ID: {group_id})')
 
     def _generate_summary(self, results: List[Dict]) -> Dict:
         """Generate summary statistics from verification results."""
         total = len(results)
-        found = len([r for r in results if r['status'] == 'FOUND'])
-        not_found = len([r for r in results if r['status'] == 'NOT_FOUND'])
-        passed = len([r for r in results if r['overall_result'] == 'PASS'])
-        failed = len([r for r in results if r['overall_result'] == 'FAIL'])
+        found = not_found = passed = failed = 0
 
         # Field-level accuracy (now includes group validation)
-        field_stats = {}
         fields = ['priority', 'urgency', 'impact', 'type', 'category', 'sub_category', 'item', 'group']
+        field_correct = dict.fromkeys(fields, 0)
+        field_total = dict.fromkeys(fields, 0)
 
-        for field in fields:
-            correct = 0
-            total_checked = 0
-            for result in results:
-                if result['status'] == 'FOUND' and field in result['comparisons']:
-                    comp = result['comparisons'][field]
-                    # All fields now count toward pass/fail (including group)
-                    if comp.get('match') is not None:
-                        total_checked += 1
-                        if comp['match']:
-                            correct += 1
+        # Group assignment distribution (for reporting which groups were used)
+        group_distribution = {}
 
+        # Single pass over the results for every counter
+        for result in results:
+            status = result['status']
+            if status == 'NOT_FOUND':
+                not_found += 1
+            overall_result = result['overall_result']
+            if overall_result == 'PASS':
+                passed += 1
+            elif overall_result == 'FAIL':
+                failed += 1
+            if status != 'FOUND':
+                continue
+            found += 1
+
+            comparisons = result['comparisons']
+            for field in fields:
+                comp = comparisons.get(field)
+                # All fields now count toward pass/fail (including group)
+                if comp is not None and comp.get('match') is not None:
+                    field_total[field] += 1
+                    if comp['match']:
+                        field_correct[field] += 1
+
+            if 'group' in comparisons:
+                group_actual = comparisons['group']['actual']
+                group_distribution[group_actual] = group_distribution.get(group_actual, 0) + 1
+
+        field_stats = {}
+        for field in fields:
+            correct = field_correct[field]
+            total_checked = field_total[field]
             field_stats[field] = {
                 'correct': correct,
                 'total': total_checked,
                 'percentage': (correct / total_checked * 100) if total_checked > 0 else 0
             }
 
-        # Group assignment distribution (for reporting which groups were used)
-        group_distribution = {}
-        for result in results:
-            if result['status'] == 'FOUND' and 'group' in result['comparisons']:
-                group_actual = result['comparisons']['group']['actual']
-                if group_actual not in group_distribution:
-                    group_distribution[group_actual] = 0
-                group_distribution[group_actual] += 1
-
         field_stats['group_distribution'] = group_distribution
 
         return {